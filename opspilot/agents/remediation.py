@@ -2,6 +2,92 @@
 
 from typing import Dict, List
 
+# Static plan fragments, built once at import. The generator copies
+# each entry into the plan so callers can mutate their plan freely
+# without corrupting the templates.
+_REDIS_IMMEDIATE_ACTIONS = (
+    {
+        "step": 1,
+        "action": "Check Redis service status",
+        "command": "redis-cli ping || systemctl status redis",
+        "risk": "LOW",
+        "estimated_time": "30 seconds",
+        "rationale": "Verify Redis is running and responsive"
+    },
+    {
+        "step": 2,
+        "action": "Check Redis connection count",
+        "command": "redis-cli info clients | grep connected_clients",
+        "risk": "LOW",
+        "estimated_time": "30 seconds",
+        "rationale": "Identify if connection pool is exhausted"
+    },
+    {
+        "step": 3,
+        "action": "Restart application service (if safe)",
+        "command": "systemctl restart app-service",
+        "risk": "MEDIUM",
+        "estimated_time": "2 minutes",
+        "rationale": "Clear stale connections and refresh connection pool"
+    },
+)
+
+_HTTP_5XX_ACTION = {
+    "action": "Check application logs for recent errors",
+    "command": "tail -100 /var/log/app/error.log",
+    "risk": "LOW",
+    "estimated_time": "1 minute",
+    "rationale": "Identify immediate cause of 5xx errors"
+}
+
+_REDIS_SHORT_TERM_FIXES = (
+    {
+        "action": "Increase Redis timeout",
+        "file": ".env or config file",
+        "change": "REDIS_TIMEOUT=1 → REDIS_TIMEOUT=5",
+        "rationale": "Reduce timeout errors under load",
+        "risk": "LOW"
+    },
+    {
+        "action": "Enable Redis connection pooling",
+        "file": "app/config/redis.py",
+        "change": "Add max_connections=50, socket_timeout=5",
+        "rationale": "Prevent connection exhaustion",
+        "risk": "LOW"
+    },
+)
+
+_REDIS_LONG_TERM_FIXES = (
+    {
+        "action": "Implement circuit breaker pattern",
+        "estimated_effort": "2-3 days",
+        "rationale": "Prevent cascading failures when Redis is unavailable"
+    },
+    {
+        "action": "Add Redis connection monitoring",
+        "estimated_effort": "1 day",
+        "rationale": "Alert on connection pool exhaustion before it causes issues"
+    },
+    {
+        "action": "Implement Redis failover/HA setup",
+        "estimated_effort": "1 week",
+        "rationale": "Ensure Redis availability with automatic failover"
+    },
+)
+
+_URGENT_VERIFICATION_STEPS = (
+    "Monitor error rate (should drop to <5/min within 5 minutes)",
+    "Check Redis connection count (should stabilize below 80% of max)",
+    "Verify application response time (should return to normal)",
+    "Check for any new errors in logs",
+)
+
+_ROUTINE_VERIFICATION_STEPS = (
+    "Monitor error rate over next 24 hours",
+    "Review application metrics for improvements",
+    "Check logs for recurring patterns",
+)
+
 
 def generate_remediation_plan(hypothesis: str, evidence: Dict, suggestions: List[Dict]) -> Dict:
     """
@@ -34,41 +120,14 @@ def generate_remediation_plan(hypothesis: str, evidence: Dict, suggestions: List
     # Generate immediate actions based on severity and evidence
     if severity in ["P0", "P1"]:
         if uses_redis and has_timeouts:
-            plan["immediate_actions"].extend([
-                {
-                    "step": 1,
-                    "action": "Check Redis service status",
-                    "command": "redis-cli ping || systemctl status redis",
-                    "risk": "LOW",
-                    "estimated_time": "30 seconds",
-                    "rationale": "Verify Redis is running and responsive"
-                },
-                {
-                    "step": 2,
-                    "action": "Check Redis connection count",
-                    "command": "redis-cli info clients | grep connected_clients",
-                    "risk": "LOW",
-                    "estimated_time": "30 seconds",
-                    "rationale": "Identify if connection pool is exhausted"
-                },
-                {
-                    "step": 3,
-                    "action": "Restart application service (if safe)",
-                    "command": "systemctl restart app-service",
-                    "risk": "MEDIUM",
-                    "estimated_time": "2 minutes",
-                    "rationale": "Clear stale connections and refresh connection pool"
-                }
-            ])
+            plan["immediate_actions"].extend(
+                dict(action) for action in _REDIS_IMMEDIATE_ACTIONS
+            )
 
         if has_http_5xx:
             plan["immediate_actions"].append({
                 "step": len(plan["immediate_actions"]) + 1,
-                "action": "Check application logs for recent errors",
-                "command": "tail -100 /var/log/app/error.log",
-                "risk": "LOW",
-                "estimated_time": "1 minute",
-                "rationale": "Identify immediate cause of 5xx errors"
+                **_HTTP_5XX_ACTION,
             })
 
     # Convert LLM suggestions to short-term fixes
@@ -85,59 +144,23 @@ def generate_remediation_plan(hypothesis: str, evidence: Dict, suggestions: List
 
     # Add standard short-term fixes based on evidence
     if uses_redis and has_timeouts:
-        plan["short_term_fixes"].extend([
-            {
-                "step": len(plan["short_term_fixes"]) + 1,
-                "action": "Increase Redis timeout",
-                "file": ".env or config file",
-                "change": "REDIS_TIMEOUT=1 → REDIS_TIMEOUT=5",
-                "rationale": "Reduce timeout errors under load",
-                "risk": "LOW"
-            },
-            {
-                "step": len(plan["short_term_fixes"]) + 1,
-                "action": "Enable Redis connection pooling",
-                "file": "app/config/redis.py",
-                "change": "Add max_connections=50, socket_timeout=5",
-                "rationale": "Prevent connection exhaustion",
-                "risk": "LOW"
-            }
-        ])
+        next_step = len(plan["short_term_fixes"]) + 1
+        plan["short_term_fixes"].extend(
+            {"step": next_step + offset, **fix}
+            for offset, fix in enumerate(_REDIS_SHORT_TERM_FIXES)
+        )
 
     # Generate long-term fixes
     if uses_redis:
-        plan["long_term_fixes"].extend([
-            {
-                "action": "Implement circuit breaker pattern",
-                "estimated_effort": "2-3 days",
-                "rationale": "Prevent cascading failures when Redis is unavailable"
-            },
-            {
-                "action": "Add Redis connection monitoring",
-                "estimated_effort": "1 day",
-                "rationale": "Alert on connection pool exhaustion before it causes issues"
-            },
-            {
-                "action": "Implement Redis failover/HA setup",
-                "estimated_effort": "1 week",
-                "rationale": "Ensure Redis availability with automatic failover"
-            }
-        ])
+        plan["long_term_fixes"].extend(
+            dict(fix) for fix in _REDIS_LONG_TERM_FIXES
+        )
 
     # Generate verification steps
     if severity in ["P0", "P1"]:
-        plan["verification_steps"] = [
-            "Monitor error rate (should drop to <5/min within 5 minutes)",
-            "Check Redis connection count (should stabilize below 80% of max)",
-            "Verify application response time (should return to normal)",
-            "Check for any new errors in logs"
-        ]
+        plan["verification_steps"] = list(_URGENT_VERIFICATION_STEPS)
     else:
-        plan["verification_steps"] = [
-            "Monitor error rate over next 24 hours",
-            "Review application metrics for improvements",
-            "Check logs for recurring patterns"
-        ]
+        plan["verification_steps"] = list(_ROUTINE_VERIFICATION_STEPS)
 
     return plan
 
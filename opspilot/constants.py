@@ -10,15 +10,24 @@ BUILD_CMD_TIMEOUT = 120
 PRODUCTION_LOG_TIMEOUT = 30
 OLLAMA_SUBPROCESS_TIMEOUT = 5
 
+# Shared HTTP session pool settings
+HTTP_POOL_CONNECTIONS = 16  # cached connection pools (one per host)
+HTTP_POOL_MAXSIZE = 32  # keep-alive connections per pool
+HTTP_CONNECT_TIMEOUT = 10  # seconds to establish TCP+TLS, separate from read
+
 # Retry settings
 LLM_MAX_RETRIES = 3
 LLM_RETRY_DELAY = 1.0  # seconds
+LLM_RETRY_MAX_DELAY = 30.0  # cap on any single backoff sleep (seconds)
 LLM_RETRY_MULTIPLIER = 2.0  # exponential backoff multiplier
 
 # Circuit breaker settings
 CIRCUIT_BREAKER_THRESHOLD = 5  # failures before opening circuit
 CIRCUIT_BREAKER_TIMEOUT = 60  # seconds before trying again
 
+# Production log fetch cap (in bytes)
+PRODUCTION_LOG_MAX_BYTES = 10 * 1024 * 1024
+
 # Truncation limits (in characters)
 LOG_TRUNCATE_LIMIT = 5000
 BUILD_ERROR_TRUNCATE_LIMIT = 4000
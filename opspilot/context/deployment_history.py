@@ -1,10 +1,41 @@
 """Deployment and Git history correlation for incident analysis."""
 
 import subprocess
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from pathlib import Path
 
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
+# Overall budget (seconds) for a streamed git subprocess, matching the
+# hard timeout the buffered subprocess.run calls get.
+_GIT_STREAM_TIMEOUT = 10
+
+
+def _arm_watchdog(proc):
+    """Arm a timer that kills `proc` once _GIT_STREAM_TIMEOUT elapses.
+
+    A plain readline loop has no way to interrupt a stalled child;
+    killing it forces stdout to EOF so the loop unblocks. Returns the
+    timer (caller cancels it when done) and an event that records
+    whether the deadline fired.
+    """
+    expired = threading.Event()
+
+    def _expire():
+        expired.set()
+        proc.kill()
+
+    timer = threading.Timer(_GIT_STREAM_TIMEOUT, _expire)
+    timer.daemon = True
+    timer.start()
+    return timer, expired
+
 
 def get_recent_commits(repo_path: str, since_hours: int = 24, limit: int = 20) -> List[Dict]:
     """
@@ -18,6 +49,13 @@ def get_recent_commits(repo_path: str, since_hours: int = 24, limit: int = 20) -
     Returns:
         List of commit dictionaries with hash, author, date, message
     """
+    # In-process libgit2 walk when pygit2 is installed (no fork+exec)
+    if PYGIT2_AVAILABLE:
+        try:
+            return _get_recent_commits_pygit2(repo_path, since_hours, limit)
+        except Exception:
+            pass  # Fall back to the git CLI
+
     try:
         since_time = datetime.now() - timedelta(hours=since_hours)
         since_str = since_time.strftime("%Y-%m-%d %H:%M:%S")
@@ -30,30 +68,48 @@ def get_recent_commits(repo_path: str, since_hours: int = 24, limit: int = 20) -
             "--pretty=format:%H|%an|%ai|%s"
         ]
 
-        result = subprocess.run(
+        # Stream stdout line-by-line instead of buffering the whole log;
+        # peak memory stays at one line and we can stop at the limit
+        # early. stderr goes to DEVNULL so git can never block writing
+        # to an unread pipe while we consume stdout.
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            timeout=10
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
         )
 
-        if result.returncode != 0:
-            print(f"Git log failed: {result.stderr}")
-            return []
-
         commits = []
-        for line in result.stdout.strip().split("\n"):
-            if not line:
-                continue
+        watchdog, expired = _arm_watchdog(proc)
+        try:
+            for line in proc.stdout:
+                line = line.rstrip("\n")
+                if not line:
+                    continue
+
+                parts = line.split("|", 3)
+                if len(parts) == 4:
+                    commits.append({
+                        "hash": parts[0][:8],  # Short hash
+                        "author": parts[1],
+                        "date": parts[2],
+                        "message": parts[3]
+                    })
+
+                if len(commits) >= limit:
+                    break
 
-            parts = line.split("|", 3)
-            if len(parts) == 4:
-                commits.append({
-                    "hash": parts[0][:8],  # Short hash
-                    "author": parts[1],
-                    "date": parts[2],
-                    "message": parts[3]
-                })
+            proc.stdout.close()
+            returncode = proc.wait()
+        finally:
+            watchdog.cancel()
+
+        if expired.is_set():
+            raise subprocess.TimeoutExpired(cmd, _GIT_STREAM_TIMEOUT)
+
+        if returncode != 0 and not commits:
+            print(f"Git log failed with exit code {returncode}")
+            return []
 
         return commits
 
@@ -68,6 +124,45 @@ def get_recent_commits(repo_path: str, since_hours: int = 24, limit: int = 20) -
         return []
 
 
+def _get_recent_commits_pygit2(repo_path: str, since_hours: int, limit: int) -> List[Dict]:
+    """Walk recent commits in-process via libgit2 (pygit2 fast path)."""
+    since_ts = (datetime.now() - timedelta(hours=since_hours)).timestamp()
+
+    repo = pygit2.Repository(repo_path)
+    commits = []
+
+    for commit in repo.walk(repo.head.target, pygit2.GIT_SORT_TIME):
+        if commit.commit_time < since_ts:
+            break
+
+        commits.append({
+            "hash": str(commit.id)[:8],
+            "author": commit.author.name,
+            "date": datetime.fromtimestamp(commit.commit_time).strftime("%Y-%m-%d %H:%M:%S"),
+            "message": commit.message.split("\n", 1)[0]
+        })
+
+        if len(commits) >= limit:
+            break
+
+    return commits
+
+
+def _get_changed_files_pygit2(repo_path: str, commit_hash: str) -> List[str]:
+    """List files changed in a commit via libgit2 (pygit2 fast path)."""
+    repo = pygit2.Repository(repo_path)
+    commit = repo.revparse_single(commit_hash)
+
+    if commit.parents:
+        diff = commit.parents[0].tree.diff_to_tree(commit.tree)
+    else:
+        diff = commit.tree.diff_to_tree(swap=True)
+
+    # Added/modified only, matching the CLI path's --diff-filter=AM
+    wanted = (pygit2.GIT_DELTA_ADDED, pygit2.GIT_DELTA_MODIFIED)
+    return [delta.new_file.path for delta in diff.deltas if delta.status in wanted]
+
+
 def get_changed_files(repo_path: str, commit_hash: str) -> List[str]:
     """
     Get list of files changed in a specific commit.
@@ -79,10 +174,19 @@ def get_changed_files(repo_path: str, commit_hash: str) -> List[str]:
     Returns:
         List of file paths changed in the commit
     """
+    if PYGIT2_AVAILABLE:
+        try:
+            return _get_changed_files_pygit2(repo_path, commit_hash)
+        except Exception:
+            pass  # Fall back to the git CLI
+
     try:
+        # Filter server-side: risk analysis only cares about files that
+        # were added or modified; renames and deletions are noise here
         cmd = [
             "git", "-C", repo_path, "diff-tree",
             "--no-commit-id", "--name-only", "-r",
+            "--diff-filter=AM", "--no-renames",
             commit_hash
         ]
 
@@ -181,50 +285,62 @@ def analyze_deployment_impact(repo_path: str, since_hours: int = 24) -> Dict:
             "reason": f"No commits in the last {since_hours} hours"
         }
 
-    # Categorize changed files
-    all_changed_files = []
+    # Map each changed file to the commits touching it, then classify
+    # each unique path exactly once (the same path often repeats across
+    # commits, so per-(commit, file) classification is redundant work)
     high_risk_files = []
     config_files = []
 
+    file_to_commits = {}
     for commit in commits:
         files = get_changed_files(repo_path, commit["hash"])
-        all_changed_files.extend(files)
 
-        # Identify high-risk changes
         for file in files:
-            file_lower = file.lower()
+            file_to_commits.setdefault(file, []).append(commit["hash"])
+
+    for file, commit_hashes in file_to_commits.items():
+        file_lower = file.lower()
+
+        is_config = any(x in file_lower for x in [".env", "config", "settings", "docker"])
+        is_db_change = "migration" in file_lower or "schema" in file_lower
+        is_critical = any(x in file_lower for x in ["auth", "payment", "api", "gateway"])
 
+        for commit_hash in commit_hashes:
             # Config files
-            if any(x in file_lower for x in [".env", "config", "settings", "docker"]):
-                config_files.append({"file": file, "commit": commit["hash"]})
+            if is_config:
+                config_files.append({"file": file, "commit": commit_hash})
 
             # Database migrations
-            if "migration" in file_lower or "schema" in file_lower:
-                high_risk_files.append({"file": file, "commit": commit["hash"], "reason": "Database change"})
+            if is_db_change:
+                high_risk_files.append({"file": file, "commit": commit_hash, "reason": "Database change"})
 
             # Critical services
-            if any(x in file_lower for x in ["auth", "payment", "api", "gateway"]):
-                high_risk_files.append({"file": file, "commit": commit["hash"], "reason": "Critical service"})
+            if is_critical:
+                high_risk_files.append({"file": file, "commit": commit_hash, "reason": "Critical service"})
 
     # Assess risk level
+    total_commits = len(commits)
+
     if high_risk_files:
         risk_level = "HIGH"
         reason = f"{len(high_risk_files)} high-risk files changed (migrations, auth, payments)"
     elif config_files:
         risk_level = "MEDIUM"
         reason = f"{len(config_files)} configuration files changed"
-    elif len(commits) > 10:
+    elif total_commits > 10:
         risk_level = "MEDIUM"
-        reason = f"High deployment frequency ({len(commits)} commits)"
+        reason = f"High deployment frequency ({total_commits} commits)"
     else:
         risk_level = "LOW"
-        reason = f"{len(commits)} commits with standard changes"
+        reason = f"{total_commits} commits with standard changes"
 
     return {
         "has_recent_changes": True,
         "commits": commits,
-        "total_commits": len(commits),
-        "changed_files_count": len(set(all_changed_files)),
+        "total_commits": total_commits,
+        # file_to_commits is keyed by unique path, so its size is the
+        # distinct changed-file count
+        "changed_files_count": len(file_to_commits),
         "high_risk_files": high_risk_files,
         "config_files": config_files,
         "risk_level": risk_level,
@@ -248,42 +364,55 @@ def get_blame_for_error(repo_path: str, file_path: str, line_number: int) -> Opt
         cmd = [
             "git", "-C", repo_path, "blame",
             "-L", f"{line_number},{line_number}",
-            "--porcelain",
+            "--incremental",
             file_path
         ]
 
-        result = subprocess.run(
+        # --incremental emits one commit header block that can be consumed
+        # as a stream; stop reading once author and author-time are known
+        # instead of buffering and splitting the whole porcelain output.
+        # stderr is discarded so git can never block on an unread pipe.
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            timeout=10
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
         )
 
-        if result.returncode != 0:
-            return None
-
-        # Parse porcelain format
-        lines = result.stdout.split("\n")
-        if not lines:
-            return None
-
-        # First line: hash original_line final_line num_lines
-        parts = lines[0].split()
-        commit_hash = parts[0] if parts else "unknown"
-
-        # Extract author and date from subsequent lines
+        commit_hash = None
         author = "unknown"
         date = "unknown"
 
-        for line in lines[1:]:
-            if line.startswith("author "):
-                author = line[7:]
-            elif line.startswith("author-time "):
-                try:
-                    timestamp = int(line[12:])
-                    date = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
-                except ValueError:
-                    pass
+        watchdog, expired = _arm_watchdog(proc)
+        try:
+            for line in proc.stdout:
+                line = line.rstrip("\n")
+
+                if commit_hash is None:
+                    # First line: hash original_line final_line num_lines
+                    parts = line.split()
+                    commit_hash = parts[0] if parts else "unknown"
+                elif line.startswith("author "):
+                    author = line[7:]
+                elif line.startswith("author-time "):
+                    try:
+                        timestamp = int(line[12:])
+                        date = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+                    except ValueError:
+                        pass
+
+                if author != "unknown" and date != "unknown":
+                    break
+
+            proc.stdout.close()
+            returncode = proc.wait()
+        finally:
+            watchdog.cancel()
+
+        if expired.is_set() or commit_hash is None:
+            return None
+        if returncode != 0 and author == "unknown":
+            return None
 
         return {
             "commit": commit_hash[:8],
@@ -2,9 +2,43 @@
 
 import json
 import re
+import sys
 from pathlib import Path
 from typing import List, Dict, Optional
 
+# Interned language tags shared by every emitted dependency string
+_TAG_PYTHON = sys.intern("[python] ")
+_TAG_NODE = sys.intern("[node] ")
+_TAG_RUBY = sys.intern("[ruby] ")
+_TAG_GO = sys.intern("[go] ")
+_TAG_RUST = sys.intern("[rust] ")
+_TAG_JAVA = sys.intern("[java] ")
+
+# Parser patterns, compiled once at import — each parser may run over
+# several manifest files per analysis
+_EGG_RE = re.compile(r'egg=([a-zA-Z0-9_-]+)')
+_PKG_NAME_RE = re.compile(r'^([a-zA-Z0-9_-]+)')
+_TOML_DEP_LIST_RE = re.compile(r'(?:dependencies|requires)\s*=\s*\[(.*?)\]', re.DOTALL)
+_QUOTED_RE = re.compile(r'["\']([^"\']+)["\']')
+_GEM_RE = re.compile(r'gem\s+[\'"]([^\'"]+)[\'"](?:\s*,\s*[\'"]([^\'"]+)[\'"])?')
+_POM_DEP_RE = re.compile(
+    r'<dependency>.*?<groupId>([^<]+)</groupId>.*?<artifactId>([^<]+)</artifactId>'
+    r'(?:.*?<version>([^<]+)</version>)?.*?</dependency>',
+    re.DOTALL,
+)
+_GRADLE_DEP_RE = re.compile(
+    r'(?:implementation|compile|testImplementation|testCompile|api|runtimeOnly)\s*[\'"]([^\'"]+)[\'"]'
+)
+
+
+def _read_text(file_path: Path) -> str:
+    """Read a file as UTF-8, ignoring undecodable bytes.
+
+    Reads raw bytes and decodes once, avoiding the TextIOWrapper
+    line-buffering overhead of Path.read_text for these small files.
+    """
+    return file_path.read_bytes().decode("utf-8", "ignore")
+
 
 def read_dependencies(project_root: str) -> List[str]:
     """
@@ -27,51 +61,16 @@ def read_dependencies(project_root: str) -> List[str]:
     root = Path(project_root)
     dependencies = []
 
-    # Python - requirements.txt
-    if (root / "requirements.txt").exists():
-        deps = parse_requirements_txt(root / "requirements.txt")
-        dependencies.extend([f"[python] {d}" for d in deps])
-
-    # Python - Pipfile
-    if (root / "Pipfile").exists():
-        deps = parse_pipfile(root / "Pipfile")
-        dependencies.extend([f"[python] {d}" for d in deps])
-
-    # Python - pyproject.toml
-    if (root / "pyproject.toml").exists():
-        deps = parse_pyproject_toml(root / "pyproject.toml")
-        dependencies.extend([f"[python] {d}" for d in deps])
+    for filename, parser, tag in _DEPENDENCY_PARSERS:
+        path = root / filename
+        if path.exists():
+            dependencies.extend([tag + d for d in parser(path)])
 
-    # Node.js - package.json
-    if (root / "package.json").exists():
-        deps = parse_package_json(root / "package.json")
-        dependencies.extend([f"[node] {d}" for d in deps])
-
-    # Ruby - Gemfile
-    if (root / "Gemfile").exists():
-        deps = parse_gemfile(root / "Gemfile")
-        dependencies.extend([f"[ruby] {d}" for d in deps])
-
-    # Go - go.mod
-    if (root / "go.mod").exists():
-        deps = parse_go_mod(root / "go.mod")
-        dependencies.extend([f"[go] {d}" for d in deps])
-
-    # Rust - Cargo.toml
-    if (root / "Cargo.toml").exists():
-        deps = parse_cargo_toml(root / "Cargo.toml")
-        dependencies.extend([f"[rust] {d}" for d in deps])
-
-    # Java - pom.xml
-    if (root / "pom.xml").exists():
-        deps = parse_pom_xml(root / "pom.xml")
-        dependencies.extend([f"[java] {d}" for d in deps])
-
-    # Java - build.gradle
-    for gradle_file in ["build.gradle", "build.gradle.kts"]:
-        if (root / gradle_file).exists():
-            deps = parse_build_gradle(root / gradle_file)
-            dependencies.extend([f"[java] {d}" for d in deps])
+    # Java - build.gradle (first match only)
+    for gradle_file in ("build.gradle", "build.gradle.kts"):
+        path = root / gradle_file
+        if path.exists():
+            dependencies.extend([_TAG_JAVA + d for d in parse_build_gradle(path)])
             break
 
     return dependencies
@@ -80,7 +79,7 @@ def read_dependencies(project_root: str) -> List[str]:
 def parse_requirements_txt(file_path: Path) -> List[str]:
     """Parse Python requirements.txt file."""
     try:
-        content = file_path.read_text(errors='ignore')
+        content = _read_text(file_path)
         deps = []
         for line in content.splitlines():
             line = line.strip()
@@ -90,12 +89,12 @@ def parse_requirements_txt(file_path: Path) -> List[str]:
             # Handle git+, http+ URLs
             if line.startswith(('git+', 'http+', 'https+')):
                 # Extract package name from URL
-                match = re.search(r'egg=([a-zA-Z0-9_-]+)', line)
+                match = _EGG_RE.search(line)
                 if match:
                     deps.append(match.group(1))
                 continue
             # Standard requirement line: package==version or package>=version
-            match = re.match(r'^([a-zA-Z0-9_-]+)', line)
+            match = _PKG_NAME_RE.match(line)
             if match:
                 deps.append(line)
         return deps
@@ -106,7 +105,7 @@ def parse_requirements_txt(file_path: Path) -> List[str]:
 def parse_pipfile(file_path: Path) -> List[str]:
     """Parse Python Pipfile."""
     try:
-        content = file_path.read_text(errors='ignore')
+        content = _read_text(file_path)
         deps = []
         in_packages = False
         in_dev = False
@@ -137,20 +136,19 @@ def parse_pipfile(file_path: Path) -> List[str]:
 def parse_pyproject_toml(file_path: Path) -> List[str]:
     """Parse Python pyproject.toml file."""
     try:
-        content = file_path.read_text(errors='ignore')
+        content = _read_text(file_path)
         deps = []
 
         # Simple regex-based parsing for dependencies
         # Look for dependencies = [...] or requires = [...]
-        dep_pattern = r'(?:dependencies|requires)\s*=\s*\[(.*?)\]'
-        matches = re.findall(dep_pattern, content, re.DOTALL)
+        matches = _TOML_DEP_LIST_RE.findall(content)
 
         for match in matches:
             # Extract quoted strings
-            quoted = re.findall(r'["\']([^"\']+)["\']', match)
+            quoted = _QUOTED_RE.findall(match)
             for dep in quoted:
                 # Extract package name from requirement string
-                pkg_match = re.match(r'^([a-zA-Z0-9_-]+)', dep)
+                pkg_match = _PKG_NAME_RE.match(dep)
                 if pkg_match:
                     deps.append(dep)
 
@@ -162,7 +160,7 @@ def parse_pyproject_toml(file_path: Path) -> List[str]:
 def parse_package_json(file_path: Path) -> List[str]:
     """Parse Node.js package.json file."""
     try:
-        content = file_path.read_text(errors='ignore')
+        content = _read_text(file_path)
         data = json.loads(content)
         deps = []
 
@@ -189,12 +187,11 @@ def parse_package_json(file_path: Path) -> List[str]:
 def parse_gemfile(file_path: Path) -> List[str]:
     """Parse Ruby Gemfile."""
     try:
-        content = file_path.read_text(errors='ignore')
+        content = _read_text(file_path)
         deps = []
 
         # Match gem 'name' or gem "name" with optional version
-        pattern = r'gem\s+[\'"]([^\'"]+)[\'"](?:\s*,\s*[\'"]([^\'"]+)[\'"])?'
-        matches = re.findall(pattern, content)
+        matches = _GEM_RE.findall(content)
 
         for match in matches:
             name = match[0]
@@ -212,7 +209,7 @@ def parse_gemfile(file_path: Path) -> List[str]:
 def parse_go_mod(file_path: Path) -> List[str]:
     """Parse Go go.mod file."""
     try:
-        content = file_path.read_text(errors='ignore')
+        content = _read_text(file_path)
         deps = []
 
         # Match require statements
@@ -248,7 +245,7 @@ def parse_go_mod(file_path: Path) -> List[str]:
 def parse_cargo_toml(file_path: Path) -> List[str]:
     """Parse Rust Cargo.toml file."""
     try:
-        content = file_path.read_text(errors='ignore')
+        content = _read_text(file_path)
         deps = []
 
         in_deps = False
@@ -282,7 +279,7 @@ def parse_cargo_toml(file_path: Path) -> List[str]:
 def parse_pom_xml(file_path: Path) -> List[str]:
     """Parse Java pom.xml file (simple regex-based)."""
     try:
-        content = file_path.read_text(errors='ignore')
+        content = _read_text(file_path)
         deps = []
 
         # Simple regex to extract dependencies
@@ -291,8 +288,7 @@ def parse_pom_xml(file_path: Path) -> List[str]:
         #   <artifactId>example</artifactId>
         #   <version>1.0.0</version>
         # </dependency>
-        dep_pattern = r'<dependency>.*?<groupId>([^<]+)</groupId>.*?<artifactId>([^<]+)</artifactId>(?:.*?<version>([^<]+)</version>)?.*?</dependency>'
-        matches = re.findall(dep_pattern, content, re.DOTALL)
+        matches = _POM_DEP_RE.findall(content)
 
         for match in matches:
             group_id = match[0]
@@ -308,7 +304,7 @@ def parse_pom_xml(file_path: Path) -> List[str]:
 def parse_build_gradle(file_path: Path) -> List[str]:
     """Parse Java build.gradle file."""
     try:
-        content = file_path.read_text(errors='ignore')
+        content = _read_text(file_path)
         deps = []
 
         # Match various dependency declarations
@@ -316,8 +312,7 @@ def parse_build_gradle(file_path: Path) -> List[str]:
         # implementation "group:artifact:version"
         # compile 'group:artifact:version'
         # testImplementation 'group:artifact:version'
-        pattern = r'(?:implementation|compile|testImplementation|testCompile|api|runtimeOnly)\s*[\'"]([^\'"]+)[\'"]'
-        matches = re.findall(pattern, content)
+        matches = _GRADLE_DEP_RE.findall(content)
 
         for match in matches:
             deps.append(match)
@@ -327,6 +322,20 @@ def parse_build_gradle(file_path: Path) -> List[str]:
         return []
 
 
+# Dependency file -> (parser, interned tag), in detection priority order.
+# build.gradle/.kts is handled separately (first match only).
+_DEPENDENCY_PARSERS = (
+    ("requirements.txt", parse_requirements_txt, _TAG_PYTHON),
+    ("Pipfile", parse_pipfile, _TAG_PYTHON),
+    ("pyproject.toml", parse_pyproject_toml, _TAG_PYTHON),
+    ("package.json", parse_package_json, _TAG_NODE),
+    ("Gemfile", parse_gemfile, _TAG_RUBY),
+    ("go.mod", parse_go_mod, _TAG_GO),
+    ("Cargo.toml", parse_cargo_toml, _TAG_RUST),
+    ("pom.xml", parse_pom_xml, _TAG_JAVA),
+)
+
+
 def get_project_type(project_root: str) -> Optional[str]:
     """
     Detect the primary project type based on dependency files.
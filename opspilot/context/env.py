@@ -4,6 +4,23 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# Precompiled for the per-line hot path in parse_env_content
+_KEY_RE = re.compile(r'[a-zA-Z_][a-zA-Z0-9_]*$')
+_ESCAPE_RE = re.compile(r'\\[nt"\']')
+_ESCAPES = {'\\n': '\n', '\\t': '\t', '\\"': '"', "\\'": "'"}
+
+# Env-var usage patterns, compiled once — these run against every
+# scanned source file in get_required_env_vars
+_ENV_USAGE_RES = (
+    re.compile(r'process\.env\.([A-Z_][A-Z0-9_]*)'),   # Node.js
+    re.compile(r'os\.environ\[[\'"](.*?)[\'"]\]'),     # Python
+    re.compile(r'os\.getenv\([\'"](.*?)[\'"]\)'),      # Python
+    re.compile(r'ENV\[[\'"](.*?)[\'"]\]'),             # Ruby
+    re.compile(r'os\.Getenv\([\'"](.*?)[\'"]\)'),      # Go
+    re.compile(r'\$\{([A-Z_][A-Z0-9_]*)\}'),           # Shell-style ${VAR}
+    re.compile(r'getenv\([\'"](.*?)[\'"]\)'),          # PHP
+)
+
 
 def read_env(project_root: str) -> Dict[str, str]:
     """
@@ -37,7 +54,8 @@ def read_env(project_root: str) -> Dict[str, str]:
             return env_vars
 
     try:
-        content = env_path.read_text(errors='ignore')
+        # Single read + decode (cheaper than read_text's TextIOWrapper)
+        content = env_path.read_bytes().decode("utf-8", "ignore")
         env_vars = parse_env_content(content)
     except (PermissionError, OSError):
         pass
@@ -81,7 +99,7 @@ def parse_env_content(content: str) -> Dict[str, str]:
         value = value.strip()
 
         # Skip invalid keys
-        if not key or not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', key):
+        if not key or not _KEY_RE.match(key):
             continue
 
         # Handle quoted values
@@ -104,11 +122,10 @@ def parse_env_content(content: str) -> Dict[str, str]:
         if '#' in value and not (value.startswith('"') or value.startswith("'")):
             value = value.split('#')[0].strip()
 
-        # Unescape common escape sequences
-        value = value.replace('\\n', '\n')
-        value = value.replace('\\t', '\t')
-        value = value.replace('\\"', '"')
-        value = value.replace("\\'", "'")
+        # Unescape common escape sequences in one pass (the chained
+        # str.replace version allocated a new string per sequence)
+        if '\\' in value:
+            value = _ESCAPE_RE.sub(lambda m: _ESCAPES[m.group()], value)
 
         env_vars[key] = value
 
@@ -134,17 +151,6 @@ def get_required_env_vars(project_root: str) -> List[str]:
     root = Path(project_root)
     required_vars = set()
 
-    # Patterns to search for
-    patterns = [
-        r'process\.env\.([A-Z_][A-Z0-9_]*)',  # Node.js
-        r'os\.environ\[[\'"](.*?)[\'"]\]',    # Python
-        r'os\.getenv\([\'"](.*?)[\'"]\)',     # Python
-        r'ENV\[[\'"](.*?)[\'"]\]',            # Ruby
-        r'os\.Getenv\([\'"](.*?)[\'"]\)',     # Go
-        r'\$\{([A-Z_][A-Z0-9_]*)\}',          # Shell-style ${VAR}
-        r'getenv\([\'"](.*?)[\'"]\)',         # PHP
-    ]
-
     # File extensions to scan
     extensions = ['.js', '.ts', '.jsx', '.tsx', '.py', '.rb', '.go', '.php']
 
@@ -160,10 +166,9 @@ def get_required_env_vars(project_root: str) -> List[str]:
                 continue
 
             try:
-                content = f.read_text(errors='ignore')
-                for pattern in patterns:
-                    matches = re.findall(pattern, content)
-                    required_vars.update(matches)
+                content = f.read_bytes().decode("utf-8", "ignore")
+                for pattern in _ENV_USAGE_RES:
+                    required_vars.update(pattern.findall(content))
             except (PermissionError, OSError):
                 continue
 
@@ -1,9 +1,113 @@
 """Log file reading and aggregation for local project logs."""
 
+import fnmatch
+import heapq
+import mmap
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import List, Optional
 from opspilot.constants import LOG_TRUNCATE_LIMIT, LOG_FILE_PATTERNS
 
+MAX_LOG_FILE_SIZE = 10 * 1024 * 1024  # Skip files larger than 10MB
+
+# Named logs commonly found in project roots (in addition to patterns)
+NAMED_LOG_FILES = [
+    "app.log",
+    "error.log",
+    "debug.log",
+    "server.log",
+    "application.log",
+    "output.log",
+    "stderr.log",
+    "stdout.log",
+]
+
+# Glob patterns translated and unioned into a single regex at import
+# time: one scandir per directory, one regex test per entry name.
+_LOG_NAME_REGEX = re.compile(
+    "|".join(fnmatch.translate(p) for p in LOG_FILE_PATTERNS + NAMED_LOG_FILES)
+)
+_FIND_NAME_REGEX = re.compile(
+    "|".join(fnmatch.translate(p) for p in LOG_FILE_PATTERNS)
+)
+
+
+def _scan_log_dir(log_dir: Path, name_regex):
+    """
+    Lazily yield (path, stat_result) tuples for regular files in a
+    directory whose names match the compiled pattern union.
+    """
+    try:
+        entries = os.scandir(log_dir)
+    except (FileNotFoundError, NotADirectoryError, PermissionError, OSError):
+        return
+
+    with entries:
+        for entry in entries:
+            if not name_regex.match(entry.name):
+                continue
+            try:
+                # is_file/stat results are cached on the DirEntry
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                yield entry.path, entry.stat()
+            except (PermissionError, OSError):
+                continue
+
+
+def _collect_log_files(root: Path, name_regex, max_file_size: Optional[int] = None) -> dict:
+    """
+    Scan the common log directories once and return {path: stat_result}.
+
+    A single dict is shared across all directory scans, so a file seen
+    under one search root is never stat'd or recorded twice.
+    """
+    # Nonexistent project root means none of the candidate log
+    # directories can exist either — skip the four scandir attempts
+    if not root.is_dir():
+        return {}
+
+    log_dirs = [
+        root / "logs",
+        root / "log",
+        root / "var" / "log",
+        root,  # Also check project root
+    ]
+
+    log_files = {}
+    for log_dir in log_dirs:
+        for path, st in _scan_log_dir(log_dir, name_regex):
+            if max_file_size is not None and st.st_size >= max_file_size:
+                continue
+            log_files[path] = st
+    return log_files
+
+
+def _read_tail(path: str, size: int, limit: int) -> str:
+    """
+    Read at most the last `limit` bytes of a file as text.
+
+    Memory-maps the file so the kernel only pages in the tail we touch,
+    instead of reading and decoding the whole file just to slice off
+    the front.
+    """
+    if size == 0:
+        return ""
+
+    start = max(0, size - limit)
+
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[start:].decode("utf-8", "ignore")
+        except (ValueError, OSError):
+            # mmap can fail on special files or exotic filesystems;
+            # seek-and-read still avoids touching the discarded front
+            f.seek(start)
+            return f.read().decode("utf-8", "ignore")
+
 
 def read_logs(project_root: str, max_size: int = LOG_TRUNCATE_LIMIT) -> Optional[str]:
     """
@@ -28,75 +132,48 @@ def read_logs(project_root: str, max_size: int = LOG_TRUNCATE_LIMIT) -> Optional
         Combined log content from most recent files, or None if no logs found
     """
     root = Path(project_root)
-    log_files = []
 
-    # Search in common log directories
-    log_dirs = [
-        root / "logs",
-        root / "log",
-        root / "var" / "log",
-        root,  # Also check project root
-    ]
-
-    # Patterns to search for
-    patterns = LOG_FILE_PATTERNS + [
-        "app.log",
-        "error.log",
-        "debug.log",
-        "server.log",
-        "application.log",
-        "output.log",
-        "stderr.log",
-        "stdout.log",
-    ]
-
-    # Collect all matching log files
-    for log_dir in log_dirs:
-        if not log_dir.exists():
-            continue
-
-        for pattern in patterns:
-            try:
-                matches = list(log_dir.glob(pattern))
-                # Filter out directories and very large files (>10MB)
-                for f in matches:
-                    if f.is_file() and f.stat().st_size < 10 * 1024 * 1024:
-                        log_files.append(f)
-            except (PermissionError, OSError):
-                continue
+    # Collect all matching log files (one scandir per directory, one
+    # shared seen-set across directories)
+    log_files = _collect_log_files(root, _LOG_NAME_REGEX, MAX_LOG_FILE_SIZE)
 
     if not log_files:
         return None
 
-    # Remove duplicates and sort by modification time (most recent first)
-    log_files = list(set(log_files))
-    log_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+    # Only the 5 most recent files are ever read, so select those with
+    # a bounded heap (O(N log 5)) instead of fully sorting; stat results
+    # were cached during the scan so no extra syscalls happen here
+    ordered = heapq.nlargest(5, log_files.items(), key=lambda item: item[1].st_mtime)
+
+    # Read the (at most 5) tails concurrently — the work is I/O-bound —
+    # then assemble serially so the size budget stays deterministic
+    def read_one(item):
+        path, st = item
+        try:
+            # Only the tail is ever kept, so only map/decode the tail
+            return _read_tail(path, st.st_size, max_size // 2)
+        except (PermissionError, OSError, UnicodeDecodeError):
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(4, len(ordered))) as executor:
+        contents = list(executor.map(read_one, ordered))
 
-    # Read and combine logs, prioritizing recent files
     combined_logs = []
     total_size = 0
-    files_read = 0
 
-    for log_file in log_files:
-        if total_size >= max_size or files_read >= 5:  # Max 5 files
+    for (path, st), content in zip(ordered, contents):
+        if total_size >= max_size:
             break
+        if content is None:
+            continue
 
-        try:
-            content = log_file.read_text(errors="ignore")
-            # Take the last portion if file is large
-            if len(content) > max_size // 2:
-                content = content[-(max_size // 2):]
-
-            remaining_space = max_size - total_size
-            if len(content) > remaining_space:
-                content = content[-remaining_space:]
+        remaining_space = max_size - total_size
+        if len(content) > remaining_space:
+            content = content[-remaining_space:]
 
-            combined_logs.append(f"=== {log_file.name} ===\n{content}")
-            total_size += len(content) + len(log_file.name) + 10
-            files_read += 1
-
-        except (PermissionError, OSError, UnicodeDecodeError):
-            continue
+        name = os.path.basename(path)
+        combined_logs.append(f"=== {name} ===\n{content}")
+        total_size += len(content) + len(name) + 10
 
     if not combined_logs:
         return None
@@ -112,27 +189,7 @@ def find_log_files(project_root: str) -> List[Path]:
         List of Path objects for log files found
     """
     root = Path(project_root)
-    log_files = []
-
-    log_dirs = [
-        root / "logs",
-        root / "log",
-        root / "var" / "log",
-        root,
-    ]
-
-    for log_dir in log_dirs:
-        if not log_dir.exists():
-            continue
-
-        for pattern in LOG_FILE_PATTERNS:
-            try:
-                matches = list(log_dir.glob(pattern))
-                log_files.extend([f for f in matches if f.is_file()])
-            except (PermissionError, OSError):
-                continue
-
-    return list(set(log_files))
+    return [Path(p) for p in _collect_log_files(root, _FIND_NAME_REGEX)]
 
 
 def get_log_summary(project_root: str) -> dict:
@@ -142,7 +199,10 @@ def get_log_summary(project_root: str) -> dict:
     Returns:
         Dictionary with log file information
     """
-    log_files = find_log_files(project_root)
+    # Work on the raw {path_str: stat} scan results directly: the stat
+    # results were cached during the scan, and keeping paths as strings
+    # avoids a Path construction and re-stringification per file
+    log_files = _collect_log_files(Path(project_root), _FIND_NAME_REGEX)
 
     if not log_files:
         return {"found": False, "files": [], "total_size": 0}
@@ -150,19 +210,14 @@ def get_log_summary(project_root: str) -> dict:
     file_info = []
     total_size = 0
 
-    for f in log_files:
-        try:
-            size = f.stat().st_size
-            mtime = f.stat().st_mtime
-            file_info.append({
-                "name": f.name,
-                "path": str(f),
-                "size": size,
-                "modified": mtime,
-            })
-            total_size += size
-        except (PermissionError, OSError):
-            continue
+    for path, st in log_files.items():
+        file_info.append({
+            "name": os.path.basename(path),
+            "path": path,
+            "size": st.st_size,
+            "modified": st.st_mtime,
+        })
+        total_size += st.st_size
 
     # Sort by modification time
     file_info.sort(key=lambda x: x["modified"], reverse=True)
@@ -1,26 +1,72 @@
 """Production log fetching from various sources."""
 
-import requests
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
-import subprocess
 
+from opspilot.constants import PRODUCTION_LOG_MAX_BYTES
 
-def fetch_logs_from_url(url: str, timeout: int = 30) -> Optional[str]:
+# requests/subprocess are imported lazily inside the fetch functions:
+# collect_context imports this module transitively, and local-file-only
+# runs should not pay the requests import cost (~40ms, several MB RSS).
+
+
+def __getattr__(name):
+    """Resolve lazy module attributes (PEP 562) for requests/subprocess.
+
+    Keeps `opspilot.context.production_logs.requests` patchable in tests
+    without importing the modules until they are actually needed.
+    """
+    if name in ("requests", "subprocess"):
+        module = importlib.import_module(name)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=8)
+def _boto3_client(service: str, profile: Optional[str]):
+    """Build (and cache) a boto3 client; raises ImportError if absent."""
+    import boto3  # Optional dependency, imported lazily
+
+    session = boto3.session.Session(profile_name=profile)
+    return session.client(service)
+
+
+def fetch_logs_from_url(url: str, timeout: int = 30,
+                        max_bytes: int = PRODUCTION_LOG_MAX_BYTES) -> Optional[str]:
     """
     Fetch logs from HTTP/HTTPS URL.
 
+    Streams the body in chunks and stops at max_bytes, so an unbounded
+    logs endpoint cannot blow up memory; decoding happens once at the
+    end (explicit UTF-8, no chardet detection pass).
+
     Args:
         url: Log file URL
         timeout: Request timeout in seconds
+        max_bytes: Stop downloading after this many bytes
 
     Returns:
         Log content as string, or None if failed
     """
+    import requests  # Lazy: only URL fetches need it
+
     try:
-        response = requests.get(url, timeout=timeout)
+        response = requests.get(url, stream=True, timeout=timeout)
         response.raise_for_status()
-        return response.text
+
+        buffer = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            buffer.extend(chunk)
+            if len(buffer) >= max_bytes:
+                print(f"Log download truncated at {max_bytes} bytes: {url}")
+                break
+        response.close()
+
+        return bytes(buffer[:max_bytes]).decode("utf-8", "ignore")
     except requests.RequestException as e:
         print(f"Failed to fetch logs from {url}: {e}")
         return None
@@ -38,6 +84,18 @@ def fetch_logs_from_s3(bucket: str, key: str, profile: Optional[str] = None) ->
     Returns:
         Log content as string, or None if failed
     """
+    # In-process boto3 path when installed: skips the ~300ms aws CLI
+    # startup per call. Any failure falls back to the CLI below.
+    try:
+        body = _boto3_client("s3", profile).get_object(Bucket=bucket, Key=key)["Body"]
+        return body.read().decode("utf-8", "ignore")
+    except ImportError:
+        pass
+    except Exception as e:
+        print(f"boto3 S3 fetch failed ({e}), falling back to AWS CLI")
+
+    import subprocess  # Lazy: only CLI fallbacks need it
+
     try:
         cmd = ["aws", "s3", "cp", f"s3://{bucket}/{key}", "-"]
 
@@ -101,6 +159,8 @@ def fetch_logs_from_kubectl(namespace: str, pod: str, container: Optional[str] =
     Returns:
         Log content as string, or None if failed
     """
+    import subprocess  # Lazy: only CLI fallbacks need it
+
     try:
         cmd = ["kubectl", "logs", pod, "-n", namespace, f"--tail={tail}"]
 
@@ -143,6 +203,21 @@ def fetch_logs_from_cloudwatch(log_group: str, log_stream: str,
     Returns:
         Log content as string, or None if failed
     """
+    # In-process boto3 path when installed; falls back to the CLI.
+    try:
+        response = _boto3_client("logs", profile).get_log_events(
+            logGroupName=log_group,
+            logStreamName=log_stream,
+            limit=limit
+        )
+        return "\n".join(event["message"] for event in response.get("events", []))
+    except ImportError:
+        pass
+    except Exception as e:
+        print(f"boto3 CloudWatch fetch failed ({e}), falling back to AWS CLI")
+
+    import subprocess  # Lazy: only CLI fallbacks need it
+
     try:
         cmd = [
             "aws", "logs", "get-log-events",
@@ -177,6 +252,50 @@ def fetch_logs_from_cloudwatch(log_group: str, log_stream: str,
         return None
 
 
+def _fetch_url_source(source: str) -> Optional[str]:
+    return fetch_logs_from_url(source)
+
+
+def _fetch_s3_source(source: str) -> Optional[str]:
+    # Parse s3://bucket/key
+    parts = source[5:].split("/", 1)
+    if len(parts) == 2:
+        return fetch_logs_from_s3(parts[0], parts[1])
+    print(f"Invalid S3 path format: {source}")
+    return None
+
+
+def _fetch_k8s_source(source: str) -> Optional[str]:
+    # Parse k8s://namespace/pod or k8s://namespace/pod/container
+    parts = source[6:].split("/")
+    if len(parts) == 2:
+        return fetch_logs_from_kubectl(parts[0], parts[1])
+    elif len(parts) == 3:
+        return fetch_logs_from_kubectl(parts[0], parts[1], parts[2])
+    print(f"Invalid k8s path format: {source}")
+    return None
+
+
+def _fetch_cloudwatch_source(source: str) -> Optional[str]:
+    # Parse cw://log-group/log-stream
+    parts = source[5:].split("/", 1)
+    if len(parts) == 2:
+        return fetch_logs_from_cloudwatch(parts[0], parts[1])
+    print(f"Invalid CloudWatch path format: {source}")
+    return None
+
+
+# Prefix -> handler dispatch table; handlers call the fetch functions
+# by name so the usual module-level patching in tests still applies
+_SOURCE_HANDLERS = (
+    ("http://", _fetch_url_source),
+    ("https://", _fetch_url_source),
+    ("s3://", _fetch_s3_source),
+    ("k8s://", _fetch_k8s_source),
+    ("cw://", _fetch_cloudwatch_source),
+)
+
+
 def auto_detect_and_fetch(source: str) -> Optional[str]:
     """
     Auto-detect log source type and fetch accordingly.
@@ -196,41 +315,9 @@ def auto_detect_and_fetch(source: str) -> Optional[str]:
     """
     source = source.strip()
 
-    # HTTP/HTTPS URL
-    if source.startswith(("http://", "https://")):
-        return fetch_logs_from_url(source)
-
-    # S3 path
-    if source.startswith("s3://"):
-        # Parse s3://bucket/key
-        parts = source[5:].split("/", 1)
-        if len(parts) == 2:
-            return fetch_logs_from_s3(parts[0], parts[1])
-        else:
-            print(f"Invalid S3 path format: {source}")
-            return None
-
-    # Kubernetes
-    if source.startswith("k8s://"):
-        # Parse k8s://namespace/pod or k8s://namespace/pod/container
-        parts = source[6:].split("/")
-        if len(parts) == 2:
-            return fetch_logs_from_kubectl(parts[0], parts[1])
-        elif len(parts) == 3:
-            return fetch_logs_from_kubectl(parts[0], parts[1], parts[2])
-        else:
-            print(f"Invalid k8s path format: {source}")
-            return None
-
-    # CloudWatch
-    if source.startswith("cw://"):
-        # Parse cw://log-group/log-stream
-        parts = source[5:].split("/", 1)
-        if len(parts) == 2:
-            return fetch_logs_from_cloudwatch(parts[0], parts[1])
-        else:
-            print(f"Invalid CloudWatch path format: {source}")
-            return None
+    for prefix, handler in _SOURCE_HANDLERS:
+        if source.startswith(prefix):
+            return handler(source)
 
     # Local file (default)
     return fetch_logs_from_file(source)
@@ -246,16 +333,24 @@ def fetch_multiple_sources(sources: List[str]) -> str:
     Returns:
         Combined log content
     """
-    all_logs = []
+    if not sources:
+        return ""
 
+    # Each fetch is dominated by network/subprocess wait, so fan out on
+    # threads; executor.map preserves the input ordering of results
     for source in sources:
         print(f"Fetching logs from: {source}")
-        logs = auto_detect_and_fetch(source)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(sources))) as executor:
+        results = list(executor.map(auto_detect_and_fetch, sources))
+
+    # One formatted block per source, joined once at the end — no
+    # repeated concatenation of header fragments
+    banner = "=" * 60
+    all_logs = []
+    for source, logs in zip(sources, results):
         if logs:
-            all_logs.append(f"\n{'='*60}\n")
-            all_logs.append(f"SOURCE: {source}\n")
-            all_logs.append(f"{'='*60}\n")
-            all_logs.append(logs)
+            all_logs.append(f"\n{banner}\n\nSOURCE: {source}\n\n{banner}\n\n{logs}")
         else:
             print(f"Warning: Could not fetch logs from {source}")
 
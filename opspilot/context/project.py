@@ -1,19 +1,24 @@
-from pathlib import Path
+import os
 from typing import List, Dict
 
+# Heavy vendored/cache directories that never inform project structure
+_SKIP_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv", "vendor"}
+
 
 def scan_project_tree(project_root: str, max_depth: int = 3) -> Dict[str, List[str]]:
-    root = Path(project_root)
     structure = {}
 
-    for path in root.rglob("*"):
-        try:
-            depth = len(path.relative_to(root).parts)
-        except ValueError:
-            continue
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        rel_dir = os.path.relpath(dirpath, project_root)
+        depth = 0 if rel_dir == "." else rel_dir.count(os.sep) + 1
+
+        # Prune descent in-place: skip vendored dirs entirely, and stop
+        # recursing where child files would exceed max_depth
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+        if depth > max_depth - 2:
+            dirnames[:] = []
 
-        if depth <= max_depth and path.is_file():
-            structure.setdefault(
-                str(path.parent.relative_to(root)), []).append(path.name)
+        if filenames and depth + 1 <= max_depth:
+            structure.setdefault(rel_dir, []).extend(filenames)
 
     return structure
@@ -1,3 +1,6 @@
+import hashlib
+import json
+
 from opspilot.state import AgentState
 from opspilot.context import collect_context
 from opspilot.agents.planner import plan
@@ -8,16 +11,23 @@ from opspilot.tools import collect_evidence
 CONFIDENCE_THRESHOLD = 0.6
 
 
+def _hash_context(context) -> str:
+    payload = json.dumps(context, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 def collect_context_node(state: AgentState) -> AgentState:
     state.context = collect_context(state.project_root)
+    state.context_hash = _hash_context(state.context)
     return state
 
 
 def planner_node(state: AgentState) -> AgentState:
-    if state.hypothesis:
-        return state  # already planned this iteration
+    if state.hypothesis and state.context_hash == state.planned_context_hash:
+        return state  # context unchanged since the last plan
 
     result = plan(state.context)
+    state.planned_context_hash = state.context_hash
     state.hypothesis = result.get("hypothesis")
     state.confidence = result.get("confidence", 0.0)
     state.iteration += 1
@@ -26,7 +36,10 @@ def planner_node(state: AgentState) -> AgentState:
 
 
 def verifier_node(state: AgentState) -> AgentState:
-    state.evidence = collect_evidence(state.context)
+    # Evidence is a pure function of the context, which is collected
+    # once per run — don't recompute it on every planner/verifier loop
+    if not state.evidence:
+        state.evidence = collect_evidence(state.context)
 
     verdict = verify(state.hypothesis, state.evidence)
     state.confidence = verdict.get("confidence", state.confidence)
@@ -1,20 +1,58 @@
 import json
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 MEMORY_FILE = Path.home() / ".opspilot_memory.json"
 
 
+def _loads(data: bytes) -> List[Dict]:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(memory: List[Dict]) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(memory, option=orjson.OPT_INDENT_2)
+    return json.dumps(memory, indent=2).encode("utf-8")
+
+# In-process cache of the memory file, invalidated by mtime, so that
+# repeated save_memory calls don't re-read and re-parse the whole file
+_memory_cache: Optional[List[Dict]] = None
+_memory_mtime: Optional[float] = None
+
+
 def load_memory() -> List[Dict]:
-    if MEMORY_FILE.exists():
-        return json.loads(MEMORY_FILE.read_text())
-    return []
+    global _memory_cache, _memory_mtime
+
+    if not MEMORY_FILE.exists():
+        return []
+
+    mtime = MEMORY_FILE.stat().st_mtime
+    if _memory_cache is not None and mtime == _memory_mtime:
+        return _memory_cache
+
+    _memory_cache = _loads(MEMORY_FILE.read_bytes())
+    _memory_mtime = mtime
+    return _memory_cache
 
 
 def save_memory(entry: Dict):
+    global _memory_cache, _memory_mtime
+
     memory = load_memory()
     memory.append(entry)
-    MEMORY_FILE.write_text(json.dumps(memory, indent=2))
+    MEMORY_FILE.write_bytes(_dumps(memory))
+
+    _memory_cache = memory
+    _memory_mtime = MEMORY_FILE.stat().st_mtime
+
 
 def find_similar_issues(project_root: str, threshold: float = 0.6):
     memory = load_memory()
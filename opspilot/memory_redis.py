@@ -1,5 +1,6 @@
 """Redis-based memory system for OpsPilot with user isolation."""
 
+import functools
 import json
 import hashlib
 import time
@@ -13,6 +14,66 @@ try:
 except ImportError:
     REDIS_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads(data) -> Dict:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(payload: Dict) -> bytes:
+    # orjson emits bytes directly; redis-py accepts bytes values, so no
+    # intermediate str + UTF-8 re-encode before the socket write
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+# Connection pools shared across RedisMemory instances, keyed by
+# connection parameters: re-instantiating memory per request reuses the
+# warm TCP+AUTH connections instead of re-handshaking each time.
+_POOLS: Dict[tuple, "redis.ConnectionPool"] = {}
+
+
+def _get_pool(host: str, port: int, db: int, password: Optional[str]):
+    key = (host, port, db, password)
+    pool = _POOLS.get(key)
+    if pool is None:
+        # BlockingConnectionPool makes concurrent agent threads wait for
+        # a free connection instead of erroring out at the cap
+        pool = redis.BlockingConnectionPool(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            max_connections=32,
+            decode_responses=True
+        )
+        _POOLS[key] = pool
+    return pool
+
+
+# Redis has no native ZADD/SADD-with-expiry; these scripts make each
+# index update and its TTL refresh atomic, so a concurrent DEL can't
+# land between the add and the EXPIRE and resurrect a persistent key.
+_ZADDEX_LUA = """
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+_SADDEX_LUA = """
+redis.call('SADD', KEYS[1], ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
 
 class RedisMemory:
     """Redis-based memory with automatic TTL and user isolation."""
@@ -41,11 +102,7 @@ class RedisMemory:
             )
 
         self.redis_client = redis.Redis(
-            host=host,
-            port=port,
-            db=db,
-            password=password,
-            decode_responses=True
+            connection_pool=_get_pool(host, port, db, password)
         )
 
         # TTL from environment variable or default
@@ -54,11 +111,21 @@ class RedisMemory:
 
         self.ttl_seconds = ttl_days * 24 * 60 * 60
 
+        # Registered once; redis-py sends EVALSHA and falls back to
+        # EVAL transparently if the script cache was flushed
+        self._zaddex = self.redis_client.register_script(_ZADDEX_LUA)
+        self._saddex = self.redis_client.register_script(_SADDEX_LUA)
+
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _get_project_hash(project_root: str) -> str:
         """
         Generate unique hash for project (user isolation).
 
+        Memoized: the project root is fixed within a session, so the
+        SHA-256 is computed once per unique path rather than on every
+        Redis operation.
+
         Args:
             project_root: Absolute path to project
 
@@ -111,25 +178,30 @@ class RedisMemory:
         # Generate incident key
         incident_key = f"incident:{project_hash}:{timestamp}"
 
-        # Store incident with TTL
-        self.redis_client.setex(
-            incident_key,
-            self.ttl_seconds,
-            json.dumps(incident_data)
-        )
-
-        # Add to similarity index (sorted set by confidence)
         similarity_key = f"incidents:similar:{project_hash}"
-        self.redis_client.zadd(
-            similarity_key,
-            {incident_key: confidence}
-        )
-        self.redis_client.expire(similarity_key, self.ttl_seconds)
-
-        # Add to severity index
         severity_key = f"incidents:severity:{project_hash}:{severity}"
-        self.redis_client.sadd(severity_key, incident_key)
-        self.redis_client.expire(severity_key, self.ttl_seconds)
+
+        # All writes still go out in one pipeline (single round-trip);
+        # each index add+EXPIRE pair is additionally atomic server-side
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            # Store incident with TTL
+            pipe.setex(incident_key, self.ttl_seconds, _dumps(incident_data))
+
+            # Add to similarity index (sorted set by confidence)
+            self._zaddex(
+                keys=[similarity_key],
+                args=[confidence, incident_key, self.ttl_seconds],
+                client=pipe
+            )
+
+            # Add to severity index
+            self._saddex(
+                keys=[severity_key],
+                args=[incident_key, self.ttl_seconds],
+                client=pipe
+            )
+
+            pipe.execute()
 
         return incident_key
 
@@ -162,14 +234,15 @@ class RedisMemory:
             num=limit
         )
 
-        # Fetch incident data
-        incidents = []
-        for key in incident_keys:
-            data = self.redis_client.get(key)
-            if data:
-                incidents.append(json.loads(data))
+        return self._fetch_incidents(incident_keys)
+
+    def _fetch_incidents(self, incident_keys) -> List[Dict]:
+        """Fetch and decode a batch of incident payloads with one MGET."""
+        if not incident_keys:
+            return []
 
-        return incidents
+        raws = self.redis_client.mget(incident_keys)
+        return [_loads(data) for data in raws if data]
 
     def get_incidents_by_severity(
         self,
@@ -189,15 +262,9 @@ class RedisMemory:
         project_hash = self._get_project_hash(project_root)
         severity_key = f"incidents:severity:{project_hash}:{severity}"
 
-        incident_keys = self.redis_client.smembers(severity_key)
+        incident_keys = list(self.redis_client.smembers(severity_key))
 
-        incidents = []
-        for key in incident_keys:
-            data = self.redis_client.get(key)
-            if data:
-                incidents.append(json.loads(data))
-
-        return incidents
+        return self._fetch_incidents(incident_keys)
 
     def record_llm_metrics(
         self,
@@ -215,22 +282,21 @@ class RedisMemory:
         """
         metrics_key = f"llm:health:{provider}"
 
-        if success:
-            self.redis_client.hincrby(metrics_key, "success_count", 1)
-            self.redis_client.hset(metrics_key, "last_success", int(time.time()))
-        else:
-            self.redis_client.hincrby(metrics_key, "failure_count", 1)
-
-        # Update average latency (moving average)
-        current_avg = float(self.redis_client.hget(metrics_key, "avg_latency_ms") or 0)
-        total_calls = int(self.redis_client.hget(metrics_key, "success_count") or 0)
-
-        if total_calls > 0:
-            new_avg = ((current_avg * (total_calls - 1)) + latency_ms) / total_calls
-            self.redis_client.hset(metrics_key, "avg_latency_ms", new_avg)
-
-        # Set TTL (refresh metrics every hour)
-        self.redis_client.expire(metrics_key, 3600)
+        # Latency is tracked as (sum, count) counters — HINCRBY and
+        # HINCRBYFLOAT are individually atomic, so a plain pipeline is
+        # race-free with none of the drift of a stored moving average;
+        # get_llm_health derives the average at read time
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            if success:
+                pipe.hincrby(metrics_key, "success_count", 1)
+                pipe.hincrbyfloat(metrics_key, "sum_latency_ms", latency_ms)
+                pipe.hset(metrics_key, "last_success", int(time.time()))
+            else:
+                pipe.hincrby(metrics_key, "failure_count", 1)
+
+            # Set TTL (refresh metrics every hour)
+            pipe.expire(metrics_key, 3600)
+            pipe.execute()
 
     def get_llm_health(self, provider: str) -> Dict:
         """
@@ -245,10 +311,13 @@ class RedisMemory:
         metrics_key = f"llm:health:{provider}"
         metrics = self.redis_client.hgetall(metrics_key)
 
+        success_count = int(metrics.get("success_count", 0))
+        sum_latency_ms = float(metrics.get("sum_latency_ms", 0))
+
         return {
-            "success_count": int(metrics.get("success_count", 0)),
+            "success_count": success_count,
             "failure_count": int(metrics.get("failure_count", 0)),
-            "avg_latency_ms": float(metrics.get("avg_latency_ms", 0)),
+            "avg_latency_ms": sum_latency_ms / max(success_count, 1),
             "last_success": int(metrics.get("last_success", 0))
         }
 
@@ -261,20 +330,27 @@ class RedisMemory:
         """
         project_hash = self._get_project_hash(project_root)
 
-        # Delete similarity index
-        self.redis_client.delete(f"incidents:similar:{project_hash}")
-
-        # Delete severity indexes
-        for severity in ["P0", "P1", "P2", "P3"]:
-            severity_key = f"incidents:severity:{project_hash}:{severity}"
-            incident_keys = self.redis_client.smembers(severity_key)
-
-            # Delete individual incidents
-            for key in incident_keys:
-                self.redis_client.delete(key)
-
-            # Delete severity index
-            self.redis_client.delete(severity_key)
+        severity_keys = [
+            f"incidents:severity:{project_hash}:{severity}"
+            for severity in ("P0", "P1", "P2", "P3")
+        ]
+
+        # Gather all incident keys with the four SMEMBERS in one pipeline
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            for severity_key in severity_keys:
+                pipe.smembers(severity_key)
+            members = pipe.execute()
+
+        keys = [f"incidents:similar:{project_hash}"]
+        keys.extend(severity_keys)
+        for incident_keys in members:
+            keys.extend(incident_keys)
+
+        # UNLINK in batches: O(N/500) round-trips instead of one DELETE
+        # per key, and the actual memory free happens on a Redis
+        # background thread rather than blocking the event loop
+        for i in range(0, len(keys), 500):
+            self.redis_client.unlink(*keys[i:i + 500])
 
     def health_check(self) -> bool:
         """
@@ -1,18 +1,58 @@
-from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional
 
-@dataclass
+
 class AgentState:
-    project_root: str
-    context: Dict[str, Any] = field(default_factory=dict)
+    """Mutable per-run agent state.
+
+    A plain __slots__ class rather than a dataclass: slots drop the
+    per-instance __dict__ (smaller instances, faster attribute access)
+    and @dataclass(slots=True) needs Python 3.10+, which this package
+    does not require.
+    """
+
+    __slots__ = (
+        "project_root",
+        "context",
+        "context_hash",
+        "planned_context_hash",
+        "hypothesis",
+        "confidence",
+        "evidence",
+        "suggestions",
+        "iteration",
+        "max_iterations",
+        "terminated",
+    )
+
+    def __init__(
+        self,
+        project_root: str,
+        context: Optional[Dict[str, Any]] = None,
+        context_hash: Optional[str] = None,
+        planned_context_hash: Optional[str] = None,
+        hypothesis: Optional[str] = None,
+        confidence: float = 0.0,
+        evidence: Optional[Dict[str, Any]] = None,
+        suggestions: Optional[List[Dict[str, Any]]] = None,
+        iteration: int = 0,
+        max_iterations: int = 2,
+        terminated: bool = False,
+    ):
+        self.project_root = project_root
+        self.context = {} if context is None else context
+        # Digest of the collected context; lets the planner recognise
+        # that nothing changed since the last plan and skip a redundant
+        # LLM call
+        self.context_hash = context_hash
+        self.planned_context_hash = planned_context_hash
 
-    hypothesis: Optional[str] = None
-    confidence: float = 0.0
+        self.hypothesis = hypothesis
+        self.confidence = confidence
 
-    evidence: Dict[str, Any] = field(default_factory=dict)
-    suggestions: List[Dict[str, Any]] = field(default_factory=list)
+        self.evidence = {} if evidence is None else evidence
+        self.suggestions = [] if suggestions is None else suggestions
 
-    iteration: int = 0
-    max_iterations: int = 2
+        self.iteration = iteration
+        self.max_iterations = max_iterations
 
-    terminated: bool = False
+        self.terminated = terminated
@@ -6,6 +6,28 @@ from opspilot.tools.env_tools import find_missing_env
 from opspilot.tools.dep_tools import has_dependency
 from opspilot.tools.pattern_analysis import identify_error_patterns, build_error_timeline
 
+# Build-error patterns, compiled once. Matches are streamed through
+# finditer with a cap of 10 per family, so a noisy multi-MB build log
+# never materializes thousands of matches just to keep the first few.
+_TS_RE = re.compile(r'(?:TS-?\d+|error TS\d+)[:\s]+(.+?)(?:\n|$)', re.IGNORECASE)
+_ANGULAR_RE = re.compile(r'X \[ERROR\]\s*([^\n]+(?:\n\s+[^\n]+)*)')
+_PY_RE = re.compile(r'((?:Syntax|Import|Module|Attribute|Type|Value|Key|Index|Name)Error):\s*(.+?)(?:\n|$)')
+_NPM_RE = re.compile(r'npm (?:ERR!|error)\s+(.+?)(?:\n|$)', re.IGNORECASE)
+_GENERIC_RE = re.compile(r'(?:error|failed|fatal)[\s:]+(.+?)(?:\n|$)', re.IGNORECASE)
+# Only the file name is kept, so the line/column numbers are matched
+# but not captured — no per-match group tuple allocations
+_FILE_REF_RE = re.compile(r'([^\s:]+\.\w+):\d+(?::\d+)?')
+
+_MAX_ERRORS_PER_TYPE = 10
+
+
+def _capped_matches(regex, text, limit=_MAX_ERRORS_PER_TYPE):
+    """Yield up to `limit` match objects without building the full list."""
+    for count, match in enumerate(regex.finditer(text)):
+        if count >= limit:
+            return
+        yield match
+
 
 def parse_build_errors(build_output: str) -> dict:
     """
@@ -20,43 +42,38 @@ def parse_build_errors(build_output: str) -> dict:
     error_types = set()
 
     # TypeScript/Angular errors (TS-XXXXXX or TSxxxx)
-    ts_pattern = r'(?:TS-?\d+|error TS\d+)[:\s]+(.+?)(?:\n|$)'
-    ts_matches = re.findall(ts_pattern, build_output, re.IGNORECASE)
-    if ts_matches:
-        errors.extend([{"type": "typescript", "message": m.strip()} for m in ts_matches[:10]])
+    for m in _capped_matches(_TS_RE, build_output):
+        errors.append({"type": "typescript", "message": m.group(1).strip()})
         error_types.add("typescript")
 
     # Angular specific errors (X [ERROR])
-    angular_pattern = r'X \[ERROR\]\s*([^\n]+(?:\n\s+[^\n]+)*)'
-    angular_matches = re.findall(angular_pattern, build_output)
-    if angular_matches:
-        errors.extend([{"type": "angular", "message": m.strip()} for m in angular_matches[:10]])
+    for m in _capped_matches(_ANGULAR_RE, build_output):
+        errors.append({"type": "angular", "message": m.group(1).strip()})
         error_types.add("angular")
 
     # Python errors (SyntaxError, ImportError, etc.)
-    py_pattern = r'((?:Syntax|Import|Module|Attribute|Type|Value|Key|Index|Name)Error):\s*(.+?)(?:\n|$)'
-    py_matches = re.findall(py_pattern, build_output)
-    if py_matches:
-        errors.extend([{"type": "python", "error_class": m[0], "message": m[1].strip()} for m in py_matches[:10]])
+    for m in _capped_matches(_PY_RE, build_output):
+        errors.append({"type": "python", "error_class": m.group(1), "message": m.group(2).strip()})
         error_types.add("python")
 
     # npm/Node errors
-    npm_pattern = r'npm (?:ERR!|error)\s+(.+?)(?:\n|$)'
-    npm_matches = re.findall(npm_pattern, build_output, re.IGNORECASE)
-    if npm_matches:
-        errors.extend([{"type": "npm", "message": m.strip()} for m in npm_matches[:10]])
+    for m in _capped_matches(_NPM_RE, build_output):
+        errors.append({"type": "npm", "message": m.group(1).strip()})
         error_types.add("npm")
 
-    # Generic error/failed patterns
-    generic_pattern = r'(?:error|failed|fatal)[\s:]+(.+?)(?:\n|$)'
-    generic_matches = re.findall(generic_pattern, build_output, re.IGNORECASE)
-    if generic_matches and not errors:  # Only use if no specific errors found
-        errors.extend([{"type": "generic", "message": m.strip()} for m in generic_matches[:10]])
-        error_types.add("generic")
+    # Generic error/failed patterns (only if no specific errors found)
+    if not errors:
+        for m in _capped_matches(_GENERIC_RE, build_output):
+            errors.append({"type": "generic", "message": m.group(1).strip()})
+            error_types.add("generic")
 
-    # File references (path:line:col patterns)
-    file_refs = re.findall(r'([^\s:]+\.\w+):(\d+)(?::(\d+))?', build_output)
-    files_affected = list(set([f[0] for f in file_refs]))[:10]
+    # File references (path:line:col patterns) — bounded-set collection
+    files_seen = set()
+    for m in _FILE_REF_RE.finditer(build_output):
+        files_seen.add(m.group(1))
+        if len(files_seen) >= 10:
+            break
+    files_affected = list(files_seen)
 
     return {
         "errors": errors,
@@ -92,8 +109,8 @@ def collect_evidence(context: dict) -> dict:
             evidence["severity"] = "P1"  # Build failures are high priority
 
     # Advanced pattern analysis for logs
+    error_patterns = identify_error_patterns(logs) if logs else {}
     if logs:
-        error_patterns = identify_error_patterns(logs)
         if error_patterns:
             evidence["error_patterns"] = error_patterns
             # Don't override severity if build errors already set it
@@ -101,15 +118,31 @@ def collect_evidence(context: dict) -> dict:
                 evidence["severity"] = error_patterns.get("severity", "P3")
             evidence["error_count"] = error_patterns.get("error_count", 0)
 
-        # Timeline analysis
+        # Timeline analysis (only attached when timestamps were found —
+        # the no-timestamp result carries "unknown" placeholders)
         timeline = build_error_timeline(logs)
-        if timeline:
+        if timeline.get("total_occurrences"):
             evidence["timeline"] = timeline
 
-    # Basic log error counting (keep for backward compatibility)
-    log_errors = analyze_log_errors(logs)
-    if log_errors:
-        evidence["log_errors"] = log_errors
+    # Legacy log_errors counters: derived from the pattern scan when it
+    # already walked the log, so the text is not re-scanned a second time
+    if error_patterns:
+        log_errors = {}
+        timeout_count = error_patterns.get("timeout_errors", 0)
+        if timeout_count:
+            log_errors["Timeout"] = timeout_count
+        trace_count = error_patterns.get("stack_traces", 0)
+        if trace_count:
+            log_errors["Traceback"] = trace_count
+        exceptions = error_patterns.get("exceptions")
+        if exceptions:
+            log_errors["Exception"] = len(exceptions)
+        if log_errors:
+            evidence["log_errors"] = log_errors
+    else:
+        log_errors = analyze_log_errors(logs)
+        if log_errors:
+            evidence["log_errors"] = log_errors
 
     # Dependency detection
     if has_dependency(deps, "redis"):
@@ -1,5 +1,21 @@
 from typing import List
 
 
+class DependencyIndex:
+    """Lowercased dependency list, built once for repeated keyword checks."""
+
+    __slots__ = ("_joined",)
+
+    def __init__(self, deps: List[str]):
+        # One joined haystack: each lookup is a single C-level substring
+        # search instead of a Python loop re-lowercasing every entry.
+        # Newline separator can't appear inside a dependency spec, so
+        # keywords never match across entry boundaries.
+        self._joined = "\n".join(d.lower() for d in deps)
+
+    def has(self, keyword: str) -> bool:
+        return keyword.lower() in self._joined
+
+
 def has_dependency(deps: List[str], keyword: str) -> bool:
-    return any(keyword.lower() in d.lower() for d in deps)
+    return DependencyIndex(deps).has(keyword)
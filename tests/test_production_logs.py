@@ -1,6 +1,8 @@
 """Unit tests for production log fetching."""
 
 import pytest
+import requests
+from types import SimpleNamespace
 from unittest.mock import patch, Mock, MagicMock
 from opspilot.context.production_logs import (
     fetch_logs_from_file,
@@ -11,6 +13,19 @@ from opspilot.context.production_logs import (
 )
 
 
+@pytest.fixture
+def fake_subprocess(monkeypatch):
+    """Stub subprocess.run with a plain-object result (no Mock overhead)."""
+    def install(returncode=0, stdout="", stderr=""):
+        result = SimpleNamespace(returncode=returncode, stdout=stdout, stderr=stderr)
+        monkeypatch.setattr(
+            "opspilot.context.production_logs.subprocess.run",
+            lambda *args, **kwargs: result,
+        )
+        return result
+    return install
+
+
 class TestLocalFileLogFetching:
     """Test local file log reading."""
 
@@ -36,7 +51,7 @@ class TestURLLogFetching:
     def test_fetch_from_url_success(self, mock_get):
         """Test successful URL log fetch."""
         mock_response = Mock()
-        mock_response.text = "ERROR: Production error"
+        mock_response.iter_content.return_value = [b"ERROR: Production error"]
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
@@ -44,10 +59,21 @@ class TestURLLogFetching:
         assert result == "ERROR: Production error"
         mock_get.assert_called_once()
 
+    @patch('opspilot.context.production_logs.requests.get')
+    def test_fetch_from_url_size_cap(self, mock_get):
+        """Test download stops at the byte cap."""
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [b"x" * 100] * 10
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+
+        result = fetch_logs_from_url("https://example.com/logs/app.log", max_bytes=250)
+        assert result == "x" * 250
+
     @patch('opspilot.context.production_logs.requests.get')
     def test_fetch_from_url_failure(self, mock_get):
         """Test URL fetch failure."""
-        mock_get.side_effect = Exception("Connection failed")
+        mock_get.side_effect = requests.RequestException("Connection failed")
 
         result = fetch_logs_from_url("https://example.com/logs/app.log")
         assert result is None
@@ -56,50 +82,31 @@ class TestURLLogFetching:
 class TestS3LogFetching:
     """Test S3 log fetching."""
 
-    @patch('opspilot.context.production_logs.subprocess.run')
-    def test_fetch_from_s3_success(self, mock_run):
-        """Test successful S3 log fetch."""
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "S3 log content"
-        mock_run.return_value = mock_result
-
-        result = fetch_logs_from_s3("my-bucket", "logs/app.log")
-        assert result == "S3 log content"
-
-    @patch('opspilot.context.production_logs.subprocess.run')
-    def test_fetch_from_s3_failure(self, mock_run):
-        """Test S3 fetch failure."""
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_result.stderr = "Access denied"
-        mock_run.return_value = mock_result
+    @pytest.mark.parametrize("returncode,stdout,stderr,expected", [
+        (0, "S3 log content", "", "S3 log content"),
+        (1, "", "Access denied", None),
+    ])
+    def test_fetch_from_s3(self, fake_subprocess, returncode, stdout, stderr, expected):
+        """Test S3 log fetch success and failure."""
+        fake_subprocess(returncode=returncode, stdout=stdout, stderr=stderr)
 
         result = fetch_logs_from_s3("my-bucket", "logs/app.log")
-        assert result is None
+        assert result == expected
 
 
 class TestKubernetesLogFetching:
     """Test Kubernetes log fetching."""
 
-    @patch('opspilot.context.production_logs.subprocess.run')
-    def test_fetch_kubectl_logs_success(self, mock_run):
+    def test_fetch_kubectl_logs_success(self, fake_subprocess):
         """Test successful kubectl log fetch."""
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Pod log content"
-        mock_run.return_value = mock_result
+        fake_subprocess(stdout="Pod log content")
 
         result = fetch_logs_from_kubectl("production", "api-server")
         assert result == "Pod log content"
 
-    @patch('opspilot.context.production_logs.subprocess.run')
-    def test_fetch_kubectl_logs_with_container(self, mock_run):
+    def test_fetch_kubectl_logs_with_container(self, fake_subprocess):
         """Test kubectl log fetch with container name."""
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Container log content"
-        mock_run.return_value = mock_result
+        fake_subprocess(stdout="Container log content")
 
         result = fetch_logs_from_kubectl("production", "api-server", "app")
         assert result == "Container log content"
@@ -6,6 +6,19 @@ from opspilot.agents.remediation import (
     format_remediation_output
 )
 
+# Common evidence shape shared by the Redis tests; the fixture hands
+# out a shallow copy so individual tests can tweak it safely
+REDIS_P1_EVIDENCE = {
+    "severity": "P1",
+    "uses_redis": True,
+    "timeout_errors": 3,
+}
+
+
+@pytest.fixture
+def redis_p1_evidence():
+    return dict(REDIS_P1_EVIDENCE)
+
 
 class TestRemediationPlanGeneration:
     """Test remediation plan generation logic."""
@@ -45,21 +58,15 @@ class TestRemediationPlanGeneration:
         # P3 should not have immediate actions
         assert len(plan["immediate_actions"]) == 0
 
-    def test_redis_timeout_short_term_fixes(self):
+    def test_redis_timeout_short_term_fixes(self, redis_p1_evidence):
         """Test Redis timeout generates appropriate fixes."""
-        evidence = {
-            "severity": "P1",
-            "uses_redis": True,
-            "timeout_errors": 3
-        }
-
         suggestions = [{
             "file": ".env",
             "diff": "REDIS_TIMEOUT=1 -> REDIS_TIMEOUT=5",
             "rationale": "Increase timeout"
         }]
 
-        plan = generate_remediation_plan("Redis timeout", evidence, suggestions)
+        plan = generate_remediation_plan("Redis timeout", redis_p1_evidence, suggestions)
 
         # Should include short-term fixes
         assert len(plan["short_term_fixes"]) > 0
@@ -67,15 +74,9 @@ class TestRemediationPlanGeneration:
         # Should include suggestion from fixer agent
         assert any(".env" in fix.get("file", "") for fix in plan["short_term_fixes"])
 
-    def test_long_term_fixes_for_redis(self):
+    def test_long_term_fixes_for_redis(self, redis_p1_evidence):
         """Test long-term fixes are generated for Redis issues."""
-        evidence = {
-            "severity": "P1",
-            "uses_redis": True,
-            "timeout_errors": 3
-        }
-
-        plan = generate_remediation_plan("Redis timeout", evidence, [])
+        plan = generate_remediation_plan("Redis timeout", redis_p1_evidence, [])
 
         # Should have long-term fixes
         assert len(plan["long_term_fixes"]) > 0
@@ -102,75 +103,44 @@ class TestRemediationPlanGeneration:
 class TestRemediationFormatting:
     """Test remediation plan formatting."""
 
-    def test_format_immediate_actions(self):
-        """Test immediate actions formatting."""
-        plan = {
-            "immediate_actions": [{
-                "step": 1,
-                "action": "Check Redis status",
-                "command": "redis-cli ping",
-                "risk": "LOW",
-                "estimated_time": "30 seconds",
-                "rationale": "Verify Redis is running"
-            }]
-        }
-
-        output = format_remediation_output(plan)
-
-        assert "[!] IMMEDIATE ACTIONS" in output
-        assert "Check Redis status" in output
-        assert "redis-cli ping" in output
-        assert "Risk: LOW" in output
-
-    def test_format_short_term_fixes(self):
-        """Test short-term fixes formatting."""
-        plan = {
-            "short_term_fixes": [{
-                "step": 1,
-                "action": "Update Redis config",
-                "file": ".env",
-                "change": "REDIS_TIMEOUT=5",
-                "rationale": "Increase timeout",
-                "risk": "LOW"
-            }]
-        }
-
-        output = format_remediation_output(plan)
-
-        assert "[~] SHORT-TERM FIXES" in output
-        assert "Update Redis config" in output
-        assert ".env" in output
-
-    def test_format_long_term_fixes(self):
-        """Test long-term fixes formatting."""
-        plan = {
-            "long_term_fixes": [{
-                "action": "Implement circuit breaker",
-                "estimated_effort": "2-3 days",
-                "rationale": "Prevent cascading failures"
-            }]
-        }
-
-        output = format_remediation_output(plan)
-
-        assert "[+] LONG-TERM FIXES" in output
-        assert "circuit breaker" in output
-        assert "2-3 days" in output
-
-    def test_format_verification_steps(self):
-        """Test verification steps formatting."""
-        plan = {
-            "verification_steps": [
-                "Monitor error rate",
-                "Check Redis connections"
-            ]
-        }
-
+    @pytest.mark.parametrize("plan,expected_fragments", [
+        # Immediate actions
+        ({"immediate_actions": [{
+            "step": 1,
+            "action": "Check Redis status",
+            "command": "redis-cli ping",
+            "risk": "LOW",
+            "estimated_time": "30 seconds",
+            "rationale": "Verify Redis is running"
+        }]},
+         ["[!] IMMEDIATE ACTIONS", "Check Redis status", "redis-cli ping", "Risk: LOW"]),
+        # Short-term fixes
+        ({"short_term_fixes": [{
+            "step": 1,
+            "action": "Update Redis config",
+            "file": ".env",
+            "change": "REDIS_TIMEOUT=5",
+            "rationale": "Increase timeout",
+            "risk": "LOW"
+        }]},
+         ["[~] SHORT-TERM FIXES", "Update Redis config", ".env"]),
+        # Long-term fixes
+        ({"long_term_fixes": [{
+            "action": "Implement circuit breaker",
+            "estimated_effort": "2-3 days",
+            "rationale": "Prevent cascading failures"
+        }]},
+         ["[+] LONG-TERM FIXES", "circuit breaker", "2-3 days"]),
+        # Verification steps
+        ({"verification_steps": ["Monitor error rate", "Check Redis connections"]},
+         ["[v] VERIFICATION STEPS", "Monitor error rate", "Check Redis connections"]),
+    ])
+    def test_format_sections(self, plan, expected_fragments):
+        """Test each plan section renders with its header and content."""
         output = format_remediation_output(plan)
 
-        assert "[v] VERIFICATION STEPS" in output
-        assert "Monitor error rate" in output
-        assert "Check Redis connections" in output
+        for fragment in expected_fragments:
+            assert fragment in output
 
     def test_format_empty_plan(self):
         """Test formatting empty plan."""